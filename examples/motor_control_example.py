@@ -11,17 +11,36 @@ as the motor system state changes.
 import asyncio
 import random
 import time
-from typing import Any
+from typing import Any, Optional
 
 from mqtt_application import MqttApplication
 
+# Motor axes, in position vector order
+_AXES: tuple[str, ...] = ("x", "y", "z")
+_AXIS_INDEX = {axis: i for i, axis in enumerate(_AXES)}
+
+# Status fields returned by the get_position command (Motor Control API)
+_POSITION_RESPONSE_FIELDS = ("current_position", "speed", "moving", "homed", "temperature", "voltage", "uptime_seconds")
+
+# Moves shorter than this are treated as already at the target
+_MIN_MOVE_DISTANCE = 1e-9
+
+# Simulated sensor noise is pre-sampled into a ring buffer (size must be a power of two)
+_NOISE_BUFFER_SIZE = 4096
+_NOISE_MASK = _NOISE_BUFFER_SIZE - 1
+
 
 class MotorControlApp:
     """Motor control application with Motor Control API compliance."""
 
+    # Status publishing cadence (seconds)
+    STATUS_TICK = 0.1
+    STATUS_MOVING_INTERVAL = 1.0
+    STATUS_MAX_INTERVAL = 5.0
+
     def __init__(self, config_file: str = "config.yaml"):
         # Motor state variables
-        self.current_position = {"x": 0.0, "y": 0.0, "z": 0.0}
+        self._pos = [0.0, 0.0, 0.0]  # x, y, z - see _AXES
         self.current_speed = 100
         self.is_moving = False
         self.is_homed = False
@@ -30,7 +49,30 @@ class MotorControlApp:
         self.temperature = 25.0
         self.voltage = 12.0
         self.error_count = 0
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+
+        # Pre-sampled (temperature drift, voltage variation) pairs
+        rng = random.Random()
+        self._noise = [(rng.uniform(-0.5, 0.5), rng.uniform(-0.2, 0.2)) for _ in range(_NOISE_BUFFER_SIZE)]
+        self._noise_i = 0
+
+        # Status payload skeleton, allocated once and updated in place
+        self._status_template: dict[str, Any] = {
+            "current_position": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "speed": 0,
+            "moving": False,
+            "homed": False,
+            "temperature": 0.0,
+            "voltage": 0.0,
+            "error_count": 0,
+            "uptime_seconds": 0,
+        }
+
+        # Status updates are coalesced: state changes set _state_changed and
+        # the monitor loop publishes the latest snapshot once per tick, only
+        # if the relevant fields differ from the last published ones
+        self._state_changed = asyncio.Event()
+        self._last_sig: Optional[tuple] = None
 
         # Initialize MQTT application with motor control config
         self.app = MqttApplication(config_file)
@@ -46,38 +88,79 @@ class MotorControlApp:
         self.app.register_command("set_speed", self._set_speed_command)
         self.app.register_command("get_position", self._get_position_command)
 
-    def _update_system_status(self):
-        """Update the status payload with current system values.
+    def _update_system_status(self) -> dict[str, Any]:
+        """Record the current system values and mark the status as dirty.
+
+        This method reads the current system state and refreshes the status
+        payload. The fields match those defined in
+        motor_config.yaml under status.payload. Publishing is left to
+        _status_monitor_loop so that a burst of state changes results in a
+        single status update.
 
-        This method reads the current system state and updates the MQTT
-        status payload in one operation. The fields match those defined
-        in motor_config.yaml under status.payload.
+        Returns:
+            The refreshed status payload (shared, do not mutate)
         """
         # Simulate some sensor readings
-        self.temperature += random.uniform(-0.5, 0.5)  # Temperature drift
-        self.voltage = 12.0 + random.uniform(-0.2, 0.2)  # Voltage variation
-
-        # Build the complete status update
-        current_values = {
-            # Motor position (required by Motor Control API)
-            "current_position": self.current_position.copy(),
-            "speed": self.current_speed,
-            "moving": self.is_moving,
-            "homed": self.is_homed,
-            # System monitoring fields
-            "temperature": round(self.temperature, 1),
-            "voltage": round(self.voltage, 2),
-            "error_count": self.error_count,
-            "uptime_seconds": int(time.time() - self.start_time),
-        }
-
+        temperature_drift, voltage_variation = self._noise[self._noise_i & _NOISE_MASK]
+        self._noise_i += 1
+        self.temperature += temperature_drift
+        self.voltage = 12.0 + voltage_variation
+
+        status = self._build_status_dict()
+        self._state_changed.set()
+        return status
+
+    def _status_signature(self) -> tuple:
+        """Fields that decide whether a new status is worth publishing."""
+        return (
+            tuple(self._pos),
+            self.current_speed,
+            self.is_moving,
+            self.is_homed,
+            self.error_count,
+            round(self.temperature, 1),
+        )
+
+    def _uptime_seconds(self) -> int:
+        """Whole seconds since startup, immune to wall-clock adjustments."""
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000_000
+
+    def _position_dict(self) -> dict[str, float]:
+        """Materialize the position vector as an {x, y, z} dict for MQTT payloads."""
+        x, y, z = self._pos
+        return {"x": x, "y": y, "z": z}
+
+    def _build_status_dict(self) -> dict[str, Any]:
+        """Refresh the status template in place from the current system state.
+
+        The status publisher copies the top-level fields but keeps references to
+        nested values, so the position dict is replaced rather than mutated.
+        """
+        t = self._status_template
+        # Motor position (required by Motor Control API)
+        t["current_position"] = self._position_dict()
+        t["speed"] = self.current_speed
+        t["moving"] = self.is_moving
+        t["homed"] = self.is_homed
+        # System monitoring fields
+        t["temperature"] = round(self.temperature, 1)
+        t["voltage"] = round(self.voltage, 2)
+        t["error_count"] = self.error_count
+        t["uptime_seconds"] = self._uptime_seconds()
+        return t
+
+    def _publish_pending_status(self):
+        """Refresh the status snapshot and push it to the MQTT application.
+
+        The snapshot is rebuilt here because error paths only flag the state
+        change (see _state_changed) without refreshing the payload themselves.
+        """
         # Update the status payload in one go
-        self.app.update_status(current_values)
+        self.app.update_status(self._build_status_dict())
 
         if self.app.logger:
             self.app.logger.info(
-                f"Status updated: Position=({self.current_position['x']: .1f}, "
-                f"{self.current_position['y']: .1f}, {self.current_position['z']: .1f}), "
+                f"Status updated: Position=({self._pos[0]: .1f}, {self._pos[1]: .1f}, {self._pos[2]: .1f}), "
                 f"Moving={self.is_moving}, Temp={self.temperature: .1f}°C"
             )
 
@@ -95,33 +178,46 @@ class MotorControlApp:
             if self.app.logger:
                 self.app.logger.info(f"Moving to position: {target_position}, speed: {speed}, mode: {mode}")
 
+            # Distance to travel determines the simulated movement time
+            target = [target_position.get(axis, 0) for axis in _AXES]
+            if mode == "absolute":
+                distance = sum(abs(t - p) for t, p in zip(target, self._pos))
+            else:
+                distance = sum(abs(t) for t in target)
+
+            # Already at the target: nothing to move, no need to toggle the moving state
+            if distance < _MIN_MOVE_DISTANCE:
+                if speed != self.current_speed:
+                    self.current_speed = speed
+                    self._update_system_status()
+                return {
+                    "final_position": self._position_dict(),
+                    "speed": speed,
+                    "mode": mode,
+                    "movement_time": 0.0,
+                }
+
             # Set moving state and update status
             self.is_moving = True
             self.current_speed = speed
             self._update_system_status()
 
-            # Simulate movement time based on distance
-            if mode == "absolute":
-                distance = sum(abs(target_position[axis] - self.current_position[axis]) for axis in ["x", "y", "z"])
-            else:
-                distance = sum(abs(target_position.get(axis, 0)) for axis in ["x", "y", "z"])
-
-            movement_time = max(0.1, distance / speed)  # Simple time calculation
+            movement_time = distance / speed if distance * speed > 0 else 0.1  # Simple time calculation
             await asyncio.sleep(movement_time)
 
             # Update position based on mode
             if mode == "absolute":
-                self.current_position = target_position.copy()
+                self._pos[:] = target
             elif mode == "relative":
-                for axis in ["x", "y", "z"]:
-                    self.current_position[axis] += target_position.get(axis, 0)
+                for i, delta in enumerate(target):
+                    self._pos[i] += delta
 
             # Movement complete
             self.is_moving = False
             self._update_system_status()
 
             return {
-                "final_position": self.current_position.copy(),
+                "final_position": self._position_dict(),
                 "speed": speed,
                 "mode": mode,
                 "movement_time": movement_time,
@@ -130,7 +226,7 @@ class MotorControlApp:
         except Exception:
             self.is_moving = False
             self.error_count += 1
-            self._update_system_status()
+            self._state_changed.set()  # Published by the monitor loop
             raise
 
     async def _home_command(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -152,9 +248,9 @@ class MotorControlApp:
 
             # Set home position (for this example, we home all axes)
             if axis == "all":
-                self.current_position = {"x": 0.0, "y": 0.0, "z": 0.0}
-            elif axis in ["x", "y", "z"]:
-                self.current_position[axis] = 0.0
+                self._pos[:] = [0.0, 0.0, 0.0]
+            elif axis in _AXIS_INDEX:
+                self._pos[_AXIS_INDEX[axis]] = 0.0
 
             self.is_homed = True
             self.is_moving = False
@@ -166,13 +262,13 @@ class MotorControlApp:
             return {
                 "homed": True,
                 "axis": axis,
-                "home_position": self.current_position.copy(),
+                "home_position": self._position_dict(),
             }
 
         except Exception:
             self.is_moving = False
             self.error_count += 1
-            self._update_system_status()
+            self._state_changed.set()  # Published by the monitor loop
             raise
 
     async def _stop_command(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -183,7 +279,7 @@ class MotorControlApp:
         self.is_moving = False
         self._update_system_status()
 
-        return {"stopped": True, "final_position": self.current_position.copy()}
+        return {"stopped": True, "final_position": self._position_dict()}
 
     async def _set_speed_command(self, data: dict[str, Any]) -> dict[str, Any]:
         """Handle set_speed command according to Motor Control API.
@@ -197,7 +293,7 @@ class MotorControlApp:
 
             if speed <= 0:
                 self.error_count += 1
-                self._update_system_status()
+                self._state_changed.set()
                 raise ValueError("Speed must be positive")
 
             old_speed = self.current_speed
@@ -211,42 +307,57 @@ class MotorControlApp:
 
         except Exception:
             self.error_count += 1
-            self._update_system_status()
+            self._state_changed.set()  # Published by the monitor loop
             raise
 
     async def _get_position_command(self, data: dict[str, Any]) -> dict[str, Any]:
         """Handle get_position command - returns current motor state."""
-        self._update_system_status()
+        payload = self._update_system_status()
 
-        return {
-            "current_position": self.current_position.copy(),
-            "speed": self.current_speed,
-            "moving": self.is_moving,
-            "homed": self.is_homed,
-            "temperature": self.temperature,
-            "voltage": self.voltage,
-            "uptime_seconds": int(time.time() - self.start_time),
-        }
+        return {field: payload[field] for field in _POSITION_RESPONSE_FIELDS}
 
     async def _status_monitor_loop(self):
-        """Background task to periodically update status."""
+        """Background task that publishes coalesced status updates.
+
+        Wakes up as soon as the state changes, waits one tick so that further
+        changes are folded into the same payload, and otherwise refreshes the
+        sensor readings every STATUS_MOVING_INTERVAL seconds while moving or
+        STATUS_MAX_INTERVAL seconds when idle. Nothing is published unless
+        the status signature changed since the last publish.
+        """
         while True:
             try:
-                await asyncio.sleep(5.0)  # Update every 5 seconds
-                self._update_system_status()
+                timeout = self.STATUS_MOVING_INTERVAL if self.is_moving else self.STATUS_MAX_INTERVAL
+                try:
+                    await asyncio.wait_for(self._state_changed.wait(), timeout=timeout)
+                    await asyncio.sleep(self.STATUS_TICK)  # Fold bursts into one payload
+                except asyncio.TimeoutError:
+                    self._update_system_status()  # Periodic refresh of sensor readings
+                self._state_changed.clear()
+
+                signature = self._status_signature()
+                if signature != self._last_sig:
+                    self._last_sig = signature
+                    self._publish_pending_status()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 if self.app.logger:
                     self.app.logger.error(f"Error in status monitor: {e}")
+                # Not flagged as a state change: the new error count is published
+                # on the next periodic refresh, so a persistent failure can't spin
                 self.error_count += 1
 
     async def run(self):
         """Run the motor control application."""
         async with self.app as app:
+            namespace = app.app_config.get("namespace", "icsia")
+            device_id = app.app_config.get("device", {}).get("device_id", "motor_controller_01")
+            self._topic_prefix = f"{namespace}/{device_id}"
+
             # Log startup information
             startup_info = {
-                "device_id": app.app_config.get("device", {}).get("device_id", "motor_controller_01"),
+                "device_id": device_id,
                 "mqtt_broker": app.app_config.get("mqtt", {}).get("broker", "test.mosquitto.org"),
                 "status_topic": app.app_config.get("topics", {}).get("status", {}).get("current", "unknown"),
                 "command_topic": app.app_config.get("topics", {}).get("command", "unknown"),
@@ -261,14 +372,7 @@ class MotorControlApp:
             self._update_system_status()
 
             try:
-                namespace = app.app_config.get("namespace", "icsia")
-                device_id = app.app_config.get("device", {}).get("device_id", "motor_controller_01")
-                command_info = {
-                    "move": f"{namespace}/{device_id}/cmd/move",
-                    "home": f"{namespace}/{device_id}/cmd/home",
-                    "stop": f"{namespace}/{device_id}/cmd/stop",
-                    "set_speed": f"{namespace}/{device_id}/cmd/set_speed",
-                }
+                command_info = {cmd: f"{self._topic_prefix}/cmd/{cmd}" for cmd in ("move", "home", "stop", "set_speed")}
                 if app.logger:
                     app.logger.info(
                         "Motor control ready. Send MQTT commands to control the motor.",
@@ -279,10 +383,7 @@ class MotorControlApp:
 
             finally:
                 status_task.cancel()
-                try:
-                    await status_task
-                except asyncio.CancelledError:
-                    pass
+                await asyncio.gather(status_task, return_exceptions=True)
 
 
 async def main():
@@ -0,0 +1,28 @@
+"""Closed-set string values carried in MQTT payloads.
+
+Module-level constants let the hot paths pass the same string objects
+around instead of re-resolving enum members or repeating literals.
+"""
+
+from typing import Final
+
+# Acknowledgment / completion status values
+STATUS_RECEIVED: Final = "received"
+STATUS_COMPLETED: Final = "completed"
+STATUS_ERROR: Final = "error"
+
+# Operational status values reported by the status publisher
+OPERATIONAL_IDLE: Final = "idle"
+OPERATIONAL_BUSY: Final = "busy"
+OPERATIONAL_ERROR: Final = "error"
+OPERATIONAL_STATUSES: Final = frozenset((OPERATIONAL_IDLE, OPERATIONAL_BUSY, OPERATIONAL_ERROR))
+
+# Error codes (values of MqttErrorCode)
+ERR_INVALID_JSON: Final = "INVALID_JSON"
+ERR_INVALID_PAYLOAD: Final = "INVALID_PAYLOAD"
+ERR_VALIDATION_ERROR: Final = "VALIDATION_ERROR"
+ERR_UNKNOWN_COMMAND: Final = "UNKNOWN_COMMAND"
+ERR_EXECUTION_ERROR: Final = "EXECUTION_ERROR"
+ERR_INTERNAL_ERROR: Final = "INTERNAL_ERROR"
+ERR_CONNECTION_ERROR: Final = "CONNECTION_ERROR"
+ERR_TIMEOUT_ERROR: Final = "TIMEOUT_ERROR"
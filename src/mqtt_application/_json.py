@@ -0,0 +1,81 @@
+"""JSON encoding helpers with optional orjson acceleration.
+
+orjson is used when installed (``pip install muxu-io-mqtt-application[fast]``);
+otherwise the standard library ``json`` module is used. Both paths encode the
+same values: NaN and infinities become ``null`` and any type JSON has no form
+for (datetimes, dataclasses, ...) is encoded as its ``str()``.
+"""
+
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Send datetimes and dataclasses to ``default`` instead of orjson's native
+# encoding, so they come out the same as on the json path
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson is not None else 0
+
+
+def _finite(obj: Any) -> Any:
+    """Return a copy of a JSON-able structure with NaN and infinities replaced by None.
+
+    Args:
+        obj: The object to clean
+
+    Returns:
+        The object with every non-finite float replaced, containers copied as needed
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document as bytes, ready to be handed to the MQTT client
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Types orjson rejects but json accepts (e.g. non-str keys, big ints)
+            pass
+    try:
+        return json.dumps(obj, allow_nan=False, default=str).encode()
+    except ValueError as e:
+        if "Out of range float" not in str(e):
+            raise
+    # json would write NaN/Infinity, which isn't JSON; match orjson's null instead
+    return json.dumps(_finite(obj), default=str).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: The JSON document as str or bytes
+
+    Returns:
+        The deserialized object
+
+    Raises:
+        ValueError: If the document is not valid JSON (``json.JSONDecodeError``
+            and orjson's JSONDecodeError are both subclasses)
+        TypeError: If ``data`` is not str or bytes and orjson is not installed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
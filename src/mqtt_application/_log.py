@@ -0,0 +1,19 @@
+"""Logging helpers shared by the application components."""
+
+import logging
+from typing import Any
+
+
+def debug_enabled(logger: Any) -> bool:
+    """Check whether a logger will emit DEBUG messages.
+
+    MqttLogger filters by level only after the message has been built, so hot
+    paths use this to skip formatting debug messages that would be discarded.
+
+    Args:
+        logger: The MqttLogger (or compatible) instance
+
+    Returns:
+        True if DEBUG messages are emitted, False otherwise
+    """
+    return getattr(logger, "log_level", logging.DEBUG) <= logging.DEBUG
@@ -0,0 +1,26 @@
+"""Fast UTC timestamp formatting for MQTT payloads.
+
+Produces the same ``YYYY-MM-DDTHH:MM:SS.mmmZ`` strings as
+``datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")``
+but only formats the date/time prefix once per second.
+"""
+
+import time
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix), swapped as one tuple
+_cache: tuple[int, str] = (-1, "")
+
+
+def iso_z_now() -> str:
+    """Return the current UTC time as an ISO 8601 string with millisecond precision.
+
+    Returns:
+        Timestamp such as ``2024-01-01T12:00:00.123Z``
+    """
+    global _cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1_000_000:03d}Z"
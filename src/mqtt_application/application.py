@@ -4,6 +4,7 @@ import asyncio
 import os
 import signal
 import sys
+from collections.abc import Coroutine
 from typing import Any, Callable, Optional
 
 from mqtt_logger import MqttLogger
@@ -16,6 +17,20 @@ from .status_publisher import PeriodicStatusPublisher
 from .worker import create_worker_pool
 
 
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run the application's main coroutine, on uvloop when it is installed.
+
+    Args:
+        main: The coroutine to run to completion
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
+
+
 class MqttApplication:
     """Simplified MQTT application that handles all component initialization and lifecycle.
 
@@ -433,7 +448,7 @@ class MqttApplication:
         signal.signal(signal.SIGINT, handle_sigint)
 
         try:
-            asyncio.run(main())
+            _run_event_loop(main())
         except KeyboardInterrupt:
             sys.stderr.write("KeyboardInterrupt caught, exiting.\n")
         except Exception as e:
@@ -1,27 +1,43 @@
 """Asynchronous command handler for processing MQTT messages."""
 
 import asyncio
-import json
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from mqtt_logger import MqttLogger
 
+from . import _json, _ts
+from ._constants import (
+    ERR_CONNECTION_ERROR,
+    ERR_EXECUTION_ERROR,
+    ERR_INTERNAL_ERROR,
+    ERR_INVALID_JSON,
+    ERR_INVALID_PAYLOAD,
+    ERR_TIMEOUT_ERROR,
+    ERR_UNKNOWN_COMMAND,
+    ERR_VALIDATION_ERROR,
+    OPERATIONAL_BUSY,
+    OPERATIONAL_ERROR,
+    OPERATIONAL_IDLE,
+    STATUS_COMPLETED,
+    STATUS_ERROR,
+    STATUS_RECEIVED,
+)
+from ._log import debug_enabled
 from .connection_manager import MqttConnectionManager
 
 
 class MqttErrorCode(Enum):
     """Standardized MQTT error codes for consistent error handling."""
 
-    INVALID_JSON = "INVALID_JSON"
-    INVALID_PAYLOAD = "INVALID_PAYLOAD"
-    VALIDATION_ERROR = "VALIDATION_ERROR"
-    UNKNOWN_COMMAND = "UNKNOWN_COMMAND"
-    EXECUTION_ERROR = "EXECUTION_ERROR"
-    INTERNAL_ERROR = "INTERNAL_ERROR"
-    CONNECTION_ERROR = "CONNECTION_ERROR"
-    TIMEOUT_ERROR = "TIMEOUT_ERROR"
+    INVALID_JSON = ERR_INVALID_JSON
+    INVALID_PAYLOAD = ERR_INVALID_PAYLOAD
+    VALIDATION_ERROR = ERR_VALIDATION_ERROR
+    UNKNOWN_COMMAND = ERR_UNKNOWN_COMMAND
+    EXECUTION_ERROR = ERR_EXECUTION_ERROR
+    INTERNAL_ERROR = ERR_INTERNAL_ERROR
+    CONNECTION_ERROR = ERR_CONNECTION_ERROR
+    TIMEOUT_ERROR = ERR_TIMEOUT_ERROR
 
 
 class CommandValidationError(Exception):
@@ -30,6 +46,84 @@ class CommandValidationError(Exception):
     pass
 
 
+# Error message templates, formatted with the exception text where needed
+_MISSING_CMD_ID_MSG = "Missing required field 'cmd_id'. Include cmd_id field in command payload."
+_MISSING_COMMAND_MSG = "Missing required field 'command'. Include command field in payload or specify command in topic."
+_INVALID_JSON_MSG = "Invalid JSON payload: {}. Please check JSON syntax and formatting."
+_VALIDATION_ERROR_MSG = "Validation failed: {}. Please check command parameters."
+_EXECUTION_ERROR_MSG = "Command execution failed: {}. Check command implementation and parameters."
+_INTERNAL_ERROR_MSG = "Internal server error: {}. Please contact support if this persists."
+_UNKNOWN_COMMAND_MSG = "Unknown command '{}'. Available commands: {}"
+_ERROR_STATUS_FIELDS_MSG = "Error status requires both error_code and error_msg. Got error_code='{}', error_msg='{}'"
+
+# Upper bound on cached per-device response topics; device IDs come from
+# incoming topics, so the cache is reset rather than allowed to grow unbounded
+_RESPONSE_TOPIC_CACHE_SIZE = 1024
+
+
+def _safe_loads(payload: Union[str, bytes]) -> tuple[Any, Optional[str]]:
+    """Parse a command payload without raising on malformed JSON.
+
+    Args:
+        payload: The raw message payload
+
+    Returns:
+        A ``(data, error)`` tuple; ``error`` is None on success, otherwise the
+        decoder's message and ``data`` is None
+    """
+    try:
+        return _json.loads(payload), None
+    except (ValueError, TypeError) as e:
+        # json raises TypeError for non-str/bytes payloads where orjson raises its
+        # JSONDecodeError, so catch both to behave the same with or without orjson
+        return None, str(e)
+
+
+def _build_response_payload(
+    cmd_id: str,
+    status: str,
+    command_timestamp: Optional[str],
+    error_code: Optional[str],
+    error_msg: Optional[str],
+) -> dict[str, Any]:
+    """Build an acknowledgment or completion payload in a single pass.
+
+    Both response phases share the same flat layout, so the dict is built once
+    with its final key order instead of being grown field by field.
+
+    Args:
+        cmd_id: The ID of the command being reported on
+        status: The response status
+        command_timestamp: Original command timestamp for correlation
+        error_code: Error code (only included for error status)
+        error_msg: Error message (only included for error status)
+
+    Returns:
+        The response payload
+    """
+    timestamp = _ts.iso_z_now()
+    if status == STATUS_ERROR:
+        if command_timestamp:
+            return {
+                "cmd_id": cmd_id,
+                "status": status,
+                "timestamp": timestamp,
+                "command_timestamp": command_timestamp,
+                "error_code": error_code,
+                "error_msg": error_msg,
+            }
+        return {
+            "cmd_id": cmd_id,
+            "status": status,
+            "timestamp": timestamp,
+            "error_code": error_code,
+            "error_msg": error_msg,
+        }
+    if command_timestamp:
+        return {"cmd_id": cmd_id, "status": status, "timestamp": timestamp, "command_timestamp": command_timestamp}
+    return {"cmd_id": cmd_id, "status": status, "timestamp": timestamp}
+
+
 class AsyncCommandHandler:
     """Handles incoming commands asynchronously for device topics.
 
@@ -67,6 +161,7 @@ class AsyncCommandHandler:
         self.namespace = namespace
         self.ack_topic_pattern = ack_topic_pattern
         self.completion_topic_pattern = completion_topic_pattern
+        self._response_topic_cache: dict[str, tuple[str, str]] = {}
         self.commands = {
             "start_task": self.start_task,
             "stop_task": self.stop_task,
@@ -77,6 +172,11 @@ class AsyncCommandHandler:
         # Command payload validation configuration
         self.command_schemas = command_config or {}
 
+        # Compiled schemas keyed by command name; the schema itself is kept in the
+        # entry so a replaced schema is recompiled. Schemas must not be mutated in
+        # place once a command has been validated against them
+        self._compiled_schemas: dict[str, tuple[dict[str, Any], tuple[tuple, tuple]]] = {}
+
         # Reference to status publisher for updating system state
         self.status_publisher = None
 
@@ -99,6 +199,28 @@ class AsyncCommandHandler:
         """
         self.status_publisher = status_publisher
 
+    def _response_topics(self, device_id: str) -> tuple[str, str]:
+        """Return the acknowledgment and completion topics for a device.
+
+        Topics are formatted once per device ID and cached.
+
+        Args:
+            device_id: The device ID from the original topic
+
+        Returns:
+            Tuple of (ack_topic, completion_topic)
+        """
+        topics = self._response_topic_cache.get(device_id)
+        if topics is None:
+            if len(self._response_topic_cache) >= _RESPONSE_TOPIC_CACHE_SIZE:
+                self._response_topic_cache.clear()
+            topics = (
+                self.ack_topic_pattern.format(namespace=self.namespace, device_id=device_id),
+                self.completion_topic_pattern.format(namespace=self.namespace, device_id=device_id),
+            )
+            self._response_topic_cache[device_id] = topics
+        return topics
+
     async def _update_operational_status(self, status: str) -> None:
         """Update operational status with proper locking.
 
@@ -131,13 +253,13 @@ class AsyncCommandHandler:
             await self.send_acknowledgment(
                 device_id,
                 "unknown",
-                "error",
+                STATUS_ERROR,
                 command_timestamp,
-                error_code=MqttErrorCode.INVALID_PAYLOAD.value,
-                error_msg="Missing required field 'cmd_id'. Include cmd_id field in command payload.",
+                error_code=ERR_INVALID_PAYLOAD,
+                error_msg=_MISSING_CMD_ID_MSG,
             )
             self.logger.warning(f"[CommandHandler] Missing required field 'cmd_id' from topic '{topic}'")
-            await self._update_operational_status("error")
+            await self._update_operational_status(OPERATIONAL_ERROR)
             return None
 
         # Extract command from topic first (for API specs like Camera Control)
@@ -152,15 +274,13 @@ class AsyncCommandHandler:
             await self.send_acknowledgment(
                 device_id,
                 cmd_id,
-                "error",
+                STATUS_ERROR,
                 command_timestamp,
-                error_code=MqttErrorCode.INVALID_PAYLOAD.value,
-                error_msg=(
-                    "Missing required field 'command'. Include command field in payload " "or specify command in topic."
-                ),
+                error_code=ERR_INVALID_PAYLOAD,
+                error_msg=_MISSING_COMMAND_MSG,
             )
             self.logger.warning(f"[CommandHandler] Cannot determine command from topic '{topic}' or payload")
-            await self._update_operational_status("error")
+            await self._update_operational_status(OPERATIONAL_ERROR)
             return None
 
         return cmd_id, command_name
@@ -180,9 +300,10 @@ class AsyncCommandHandler:
         # Generate timestamp when message is received and processed
         # This timestamp represents when the server received/processed the command
         # Note: Client-provided timestamps are ignored - server always generates its own
-        command_timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        command_timestamp = _ts.iso_z_now()
         data["timestamp"] = command_timestamp
-        self.logger.debug(f"Generated server timestamp for command: {command_timestamp}")
+        if debug_enabled(self.logger):
+            self.logger.debug(f"Generated server timestamp for command: {command_timestamp}")
 
         return device_id, command_timestamp
 
@@ -207,25 +328,23 @@ class AsyncCommandHandler:
             Validated data with defaults applied, or None if validation failed
         """
         try:
-            # Validate command payload
-            self.validate_command_payload(command_name, data)
-
-            # Apply default values
+            # Apply default values, then validate the enriched payload
             validated_data = self.apply_defaults(command_name, data)
+            if command_name in self.command_schemas:
+                self._validate_payload_structure(command_name, validated_data, self.command_schemas[command_name])
             return validated_data
 
         except CommandValidationError as e:
-            # Phase 2: Send completion with validation error
-            await self.send_completion_status(
+            # Both phases: acknowledge and report the validation error together
+            await self.send_ack_and_completion(
                 device_id,
                 cmd_id,
-                "error",
                 command_timestamp,
-                error_code=MqttErrorCode.VALIDATION_ERROR.value,
-                error_msg=f"Validation failed: {str(e)}. Please check command parameters.",
+                error_code=ERR_VALIDATION_ERROR,
+                error_msg=_VALIDATION_ERROR_MSG.format(e),
             )
             self.logger.error(f"Command validation failed for {command_name}: {e}")
-            await self._update_operational_status("error")
+            await self._update_operational_status(OPERATIONAL_ERROR)
             return None
 
     def validate_command_payload(self, command_name: str, payload: dict[str, Any]) -> None:
@@ -262,29 +381,60 @@ class AsyncCommandHandler:
         Raises:
             CommandValidationError: If structure doesn't match
         """
-        for field_name, expected_config in schema.items():
-            # Skip standard command fields (including timestamp)
-            if field_name in ["command", "cmd_id", "timestamp"]:
-                continue
-
+        _, fields = self._compile_schema(command_name, schema)
+        for field_name, optional, expected_value, expected_hint in fields:
             # Check if field is present in payload
             if field_name not in payload:
                 # Field is missing - check if it's explicitly optional
-                if self._is_optional_field(expected_config):
+                if optional:
                     continue  # Skip optional fields
-                else:
-                    # Get expected type/value for better error message
-                    if isinstance(expected_config, dict) and "default" in expected_config:
-                        expected_hint = f"Expected type: {type(expected_config['default']).__name__}"
-                    else:
-                        expected_hint = f"Expected type: {type(expected_config).__name__}"
-
-                    raise CommandValidationError(
-                        f"Command '{command_name}' missing required field '{field_name}'. {expected_hint}"
-                    )
+                raise CommandValidationError(
+                    f"Command '{command_name}' missing required field '{field_name}'. {expected_hint}"
+                )
 
             # Validate field type and structure
-            self._validate_field_type(f"{command_name}.{field_name}", payload[field_name], expected_config)
+            self._check_field_value(f"{command_name}.{field_name}", payload[field_name], expected_value)
+
+    def _compile_schema(self, command_name: str, schema: dict[str, Any]) -> tuple[tuple, tuple]:
+        """Return the compiled form of a command schema, building it on first use.
+
+        The compiled form is a pair of tuples:
+        - defaults: (field_name, default) for every explicitly optional field
+        - fields: (field_name, optional, expected_value, expected_hint) for every
+          field that is validated (standard command fields are skipped)
+
+        The result is cached per command and reused while the command's schema is
+        the same object, so schemas must not be mutated in place after use.
+
+        Args:
+            command_name: Name of the command the schema belongs to
+            schema: The command schema
+
+        Returns:
+            Tuple of (defaults, fields)
+        """
+        cached = self._compiled_schemas.get(command_name)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        defaults = []
+        fields = []
+        for field_name, expected_config in schema.items():
+            optional = self._is_optional_field(expected_config)
+            expected_value = expected_config["default"] if optional else expected_config
+            if optional:
+                defaults.append((field_name, expected_value))
+
+            # Skip standard command fields (including timestamp)
+            if field_name in ["command", "cmd_id", "timestamp"]:
+                continue
+
+            expected_hint = f"Expected type: {type(expected_value).__name__}"
+            fields.append((field_name, optional, expected_value, expected_hint))
+
+        compiled = (tuple(defaults), tuple(fields))
+        self._compiled_schemas[command_name] = (schema, compiled)
+        return compiled
 
     def _is_optional_field(self, expected_config: Any) -> bool:
         """Check if a field is explicitly marked as optional.
@@ -298,23 +448,17 @@ class AsyncCommandHandler:
         # Only fields with explicit {"default": value} syntax are optional
         return isinstance(expected_config, dict) and "default" in expected_config
 
-    def _validate_field_type(self, field_path: str, field_value: Any, expected_config: Any) -> None:
-        """Validate that a field value matches the expected type from config.
+    def _check_field_value(self, field_path: str, field_value: Any, expected_value: Any) -> None:
+        """Validate a field value against an already unwrapped expected value.
 
         Args:
             field_path: Path to the field (for error messages)
             field_value: The actual value
-            expected_config: The expected configuration
+            expected_value: The expected value (its type is enforced)
 
         Raises:
             CommandValidationError: If type doesn't match
         """
-        # Handle default value configs
-        if isinstance(expected_config, dict) and "default" in expected_config:
-            expected_value = expected_config["default"]
-        else:
-            expected_value = expected_config
-
         expected_type = type(expected_value)
 
         # Basic type validation with coercion for numeric types
@@ -381,14 +525,12 @@ class AsyncCommandHandler:
             return payload
 
         result = payload.copy()
-        schema = self.command_schemas[command_name]
+        defaults, _ = self._compile_schema(command_name, self.command_schemas[command_name])
 
-        for field_name, expected_config in schema.items():
+        # Only explicitly optional fields have defaults; required fields must be provided
+        for field_name, default in defaults:
             if field_name not in result:
-                # Only apply defaults for explicitly optional fields
-                if self._is_optional_field(expected_config):
-                    result[field_name] = expected_config["default"]
-                # Required fields (simple values or nested) must be provided
+                result[field_name] = default
 
         return result
 
@@ -396,7 +538,7 @@ class AsyncCommandHandler:
         self,
         device_id: str,
         cmd_id: str,
-        status: str = "received",
+        status: str = STATUS_RECEIVED,
         command_timestamp: Optional[str] = None,
         error_code: Optional[str] = None,
         error_msg: Optional[str] = None,
@@ -415,38 +557,16 @@ class AsyncCommandHandler:
             ValueError: If status is "error" but error_code or error_msg is missing
         """
         # Validate error status requirements
-        if status == "error":
+        if status == STATUS_ERROR:
             if not error_code or not error_msg:
-                raise ValueError(
-                    "Error status requires both error_code and error_msg. "
-                    f"Got error_code='{error_code}', error_msg='{error_msg}'"
-                )
+                raise ValueError(_ERROR_STATUS_FIELDS_MSG.format(error_code, error_msg))
 
         if not self.connection_manager:
             self.logger.warning("Cannot send acknowledgment: no MQTT connection manager configured")
             return
 
-        ack_topic = self.ack_topic_pattern.format(namespace=self.namespace, device_id=device_id)
-        ack_data = {
-            "cmd_id": cmd_id,
-            "status": status,
-            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
-        }
-
-        # Include original command timestamp if provided
-        if command_timestamp:
-            ack_data["command_timestamp"] = command_timestamp
-
-        # Include error details if status is "error" (now guaranteed to be present)
-        if status == "error":
-            # These should never be None for error status due to validation above
-            if error_code is None or error_msg is None:
-                raise RuntimeError(
-                    f"Internal error: error_code and error_msg must be provided for error status. "
-                    f"Got error_code={error_code}, error_msg={error_msg}"
-                )
-            ack_data["error_code"] = error_code
-            ack_data["error_msg"] = error_msg
+        ack_topic = self._response_topics(device_id)[0]
+        ack_data = _build_response_payload(cmd_id, status, command_timestamp, error_code, error_msg)
 
         # Use connection manager's publish_with_retry method
         if hasattr(self.connection_manager, "publish_with_retry"):
@@ -477,38 +597,16 @@ class AsyncCommandHandler:
             ValueError: If status is "error" but error_code or error_msg is missing
         """
         # Validate error status requirements
-        if status == "error":
+        if status == STATUS_ERROR:
             if not error_code or not error_msg:
-                raise ValueError(
-                    "Error status requires both error_code and error_msg. "
-                    f"Got error_code='{error_code}', error_msg='{error_msg}'"
-                )
+                raise ValueError(_ERROR_STATUS_FIELDS_MSG.format(error_code, error_msg))
 
         if not self.connection_manager:
             self.logger.warning("Cannot send completion status: no MQTT connection manager configured")
             return
 
-        completion_topic = self.completion_topic_pattern.format(namespace=self.namespace, device_id=device_id)
-        completion_data = {
-            "cmd_id": cmd_id,
-            "status": status,
-            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
-        }
-
-        # Include original command timestamp if provided
-        if command_timestamp:
-            completion_data["command_timestamp"] = command_timestamp
-
-        # Include error details if status is "error" (now guaranteed to be present)
-        if status == "error":
-            # These should never be None for error status due to validation above
-            if error_code is None or error_msg is None:
-                raise RuntimeError(
-                    f"Internal error: error_code and error_msg must be provided for error status. "
-                    f"Got error_code={error_code}, error_msg={error_msg}"
-                )
-            completion_data["error_code"] = error_code
-            completion_data["error_msg"] = error_msg
+        completion_topic = self._response_topics(device_id)[1]
+        completion_data = _build_response_payload(cmd_id, status, command_timestamp, error_code, error_msg)
 
         # Use connection manager's publish_with_retry method
         if hasattr(self.connection_manager, "publish_with_retry"):
@@ -516,6 +614,66 @@ class AsyncCommandHandler:
         else:
             await self.connection_manager.publish(completion_topic, completion_data, qos=1)
 
+    async def _finish_acknowledgment(self, ack_task: "asyncio.Task[None]", cmd_id: str) -> None:
+        """Wait for an acknowledgment started with the command, logging rather than raising on failure.
+
+        A failed acknowledgment says nothing about the command itself, so it must
+        not turn a successful command into an execution error.
+
+        Args:
+            ack_task: The task sending the "received" acknowledgment
+            cmd_id: The ID of the command being acknowledged
+        """
+        try:
+            await ack_task
+        except Exception as e:
+            self.logger.error(f"[CommandHandler] Failed to send acknowledgment for command {cmd_id}: {e}")
+
+    async def send_ack_and_completion(
+        self,
+        device_id: str,
+        cmd_id: str,
+        command_timestamp: Optional[str],
+        error_code: str,
+        error_msg: str,
+    ) -> None:
+        """Send a "received" acknowledgment and an error completion in one batch.
+
+        Used when a command fails before execution starts, so both phases are
+        known up front and can be published back to back.
+
+        Args:
+            device_id: The device ID from the original topic
+            cmd_id: The ID of the command being reported on
+            command_timestamp: Original command timestamp for correlation
+            error_code: Error code for the completion status
+            error_msg: Error message for the completion status
+
+        Raises:
+            ValueError: If error_code or error_msg is missing
+        """
+        if not error_code or not error_msg:
+            raise ValueError(_ERROR_STATUS_FIELDS_MSG.format(error_code, error_msg))
+
+        if not self.connection_manager:
+            self.logger.warning("Cannot send acknowledgment: no MQTT connection manager configured")
+            return
+
+        ack_topic, completion_topic = self._response_topics(device_id)
+        messages = [
+            (ack_topic, _build_response_payload(cmd_id, STATUS_RECEIVED, command_timestamp, None, None)),
+            (completion_topic, _build_response_payload(cmd_id, STATUS_ERROR, command_timestamp, error_code, error_msg)),
+        ]
+
+        if hasattr(self.connection_manager, "publish_many"):
+            await self.connection_manager.publish_many(messages, qos=1)
+        elif hasattr(self.connection_manager, "publish_with_retry"):
+            for topic, payload in messages:
+                await self.connection_manager.publish_with_retry(topic, payload, qos=1)
+        else:
+            for topic, payload in messages:
+                await self.connection_manager.publish(topic, payload, qos=1)
+
     def extract_device_id_from_topic(self, topic: str) -> Optional[str]:
         """Extract device ID from topic following {namespace}/<device_id>/cmd/* pattern.
 
@@ -525,10 +683,8 @@ class AsyncCommandHandler:
         Returns:
             The device ID if topic matches pattern, None otherwise
         """
-        parts = topic.split("/")
-        if len(parts) >= 3 and parts[0] == self.namespace and parts[2] == "cmd":
-            return parts[1]
-        return None
+        parsed = self._parse_topic(topic)
+        return parsed[0] if parsed else None
 
     def extract_command_from_topic(self, topic: str) -> Optional[str]:
         """Extract command type from topic following {namespace}/<device_id>/cmd/<command> pattern.
@@ -539,10 +695,32 @@ class AsyncCommandHandler:
         Returns:
             The command type if topic matches pattern, None otherwise
         """
-        parts = topic.split("/")
-        if len(parts) >= 4 and parts[0] == self.namespace and parts[2] == "cmd":
-            return parts[3]  # settings, enable, etc.
-        return None
+        parsed = self._parse_topic(topic)
+        return parsed[1] if parsed else None  # settings, enable, etc.
+
+    def _parse_topic(self, topic: str) -> Optional[tuple[str, Optional[str]]]:
+        """Split a {namespace}/<device_id>/cmd[/<command>] topic without building a list.
+
+        Args:
+            topic: The MQTT topic to parse
+
+        Returns:
+            Tuple of (device_id, command or None) if topic matches pattern, None otherwise
+        """
+        end_namespace = topic.find("/")
+        if end_namespace == -1 or topic[:end_namespace] != self.namespace:
+            return None
+        end_device = topic.find("/", end_namespace + 1)
+        if end_device == -1:
+            return None
+        end_cmd = topic.find("/", end_device + 1)
+        if end_cmd == -1:
+            return (topic[end_namespace + 1 : end_device], None) if topic[end_device + 1 :] == "cmd" else None
+        if topic[end_device + 1 : end_cmd] != "cmd":
+            return None
+        end_command = topic.find("/", end_cmd + 1)
+        command = topic[end_cmd + 1 :] if end_command == -1 else topic[end_cmd + 1 : end_command]
+        return topic[end_namespace + 1 : end_device], command
 
     async def handle_command(self, topic: str, payload: str) -> None:
         """Parse the payload, identify the command, and execute the corresponding handler.
@@ -561,9 +739,24 @@ class AsyncCommandHandler:
             self.logger.warning(f"Cannot extract device_id from topic: {topic}")
             return
 
-        try:
-            data = json.loads(payload)
+        data, json_error = _safe_loads(payload)
+        if json_error is not None:
+            self.logger.error(f"[CommandHandler] Invalid JSON payload on topic '{topic}': {payload}")
+            # Send acknowledgment with INVALID_JSON error code
+            await self.send_acknowledgment(
+                device_id,
+                "unknown",
+                STATUS_ERROR,
+                _ts.iso_z_now(),
+                error_code=ERR_INVALID_JSON,
+                error_msg=_INVALID_JSON_MSG.format(json_error),
+            )
 
+            # Update status publisher with error
+            await self._update_operational_status(OPERATIONAL_ERROR)
+            return
+
+        try:
             # Extract command information and timestamps
             device_id, command_timestamp = self._extract_command_info(topic, data)
 
@@ -578,12 +771,10 @@ class AsyncCommandHandler:
             if "command" not in data:
                 data["command"] = command_name
 
-            # Phase 1: Send immediate acknowledgment (include original timestamp)
-            await self.send_acknowledgment(device_id, cmd_id, "received", command_timestamp)
-
             if command_name in self.commands:
                 # Create a task for command execution tracking
                 command_task = None
+                ack_task = None
                 try:
                     # Validate command payload and apply defaults
                     validated_data = await self._validate_command_payload_safe(
@@ -592,12 +783,18 @@ class AsyncCommandHandler:
                     if validated_data is None:
                         return  # Validation failed, error already handled
 
+                    # Phase 1: Start the acknowledgment (include original timestamp) without
+                    # waiting for delivery; it is awaited before any completion is sent
+                    ack_task = asyncio.create_task(
+                        self.send_acknowledgment(device_id, cmd_id, STATUS_RECEIVED, command_timestamp)
+                    )
+
                     self.logger.info(
                         f"[CommandHandler] Executing command: {command_name} (ID: {cmd_id}) from topic '{topic}'"
                     )
 
                     # Update status publisher to busy state
-                    await self._update_operational_status("busy")
+                    await self._update_operational_status(OPERATIONAL_BUSY)
 
                     # Execute the command with validated data and track it
                     if asyncio.iscoroutinefunction(self.commands[command_name]):
@@ -619,116 +816,102 @@ class AsyncCommandHandler:
                             self._active_commands.discard(command_future)
 
                     # Phase 2: Send completion status (include original timestamp)
-                    await self.send_completion_status(device_id, cmd_id, "completed", command_timestamp)
+                    await self._finish_acknowledgment(ack_task, cmd_id)
+                    await self.send_completion_status(device_id, cmd_id, STATUS_COMPLETED, command_timestamp)
 
                     # Update status publisher with success
                     if self.status_publisher:
                         async with self._status_publisher_lock:
                             self.status_publisher.update_last_command_time()
-                    await self._update_operational_status("idle")
+                    await self._update_operational_status(OPERATIONAL_IDLE)
+
+                except asyncio.CancelledError:
+                    if ack_task is not None:
+                        # Don't leave the acknowledgment running or its failure unretrieved
+                        ack_task.cancel()
+                        await asyncio.gather(ack_task, return_exceptions=True)
+                    raise
 
                 except Exception as e:
                     # Phase 2: Send completion with execution error
-                    await self.send_completion_status(
-                        device_id,
-                        cmd_id,
-                        "error",
-                        command_timestamp,
-                        error_code=MqttErrorCode.EXECUTION_ERROR.value,
-                        error_msg=f"Command execution failed: {str(e)}. Check command implementation and parameters.",
-                    )
+                    error_msg = _EXECUTION_ERROR_MSG.format(e)
+                    if ack_task is not None:
+                        # Keep the acknowledgment ahead of the completion
+                        await self._finish_acknowledgment(ack_task, cmd_id)
+                        await self.send_completion_status(
+                            device_id,
+                            cmd_id,
+                            STATUS_ERROR,
+                            command_timestamp,
+                            error_code=ERR_EXECUTION_ERROR,
+                            error_msg=error_msg,
+                        )
+                    else:
+                        await self.send_ack_and_completion(
+                            device_id,
+                            cmd_id,
+                            command_timestamp,
+                            error_code=ERR_EXECUTION_ERROR,
+                            error_msg=error_msg,
+                        )
 
                     # Update status publisher with error
-                    await self._update_operational_status("error")
+                    await self._update_operational_status(OPERATIONAL_ERROR)
 
                     self.logger.error(f"Error executing command {command_name}: {e}")
             else:
                 self.logger.warning(f"[CommandHandler] Unknown command: '{command_name}' on topic '{topic}'")
 
-                # Phase 2: Send completion with error for unknown command
-                await self.send_completion_status(
+                # Both phases: acknowledge and report the unknown command together
+                await self.send_ack_and_completion(
                     device_id,
                     cmd_id,
-                    "error",
                     command_timestamp,
-                    error_code=MqttErrorCode.UNKNOWN_COMMAND.value,
-                    error_msg=(
-                        f"Unknown command '{command_name}'. " f"Available commands: {', '.join(self.commands.keys())}"
-                    ),
+                    error_code=ERR_UNKNOWN_COMMAND,
+                    error_msg=_UNKNOWN_COMMAND_MSG.format(command_name, ", ".join(self.commands)),
                 )
 
                 # Update status publisher with error for unknown command
-                await self._update_operational_status("error")
-
-        except json.JSONDecodeError as e:
-            self.logger.error(f"[CommandHandler] Invalid JSON payload on topic '{topic}': {payload}")
-            # Send acknowledgment with INVALID_JSON error code
-            error_timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
-            await self.send_acknowledgment(
-                device_id,
-                "unknown",
-                "error",
-                error_timestamp,
-                error_code=MqttErrorCode.INVALID_JSON.value,
-                error_msg=f"Invalid JSON payload: {str(e)}. Please check JSON syntax and formatting.",
-            )
-
-            # Update status publisher with error
-            await self._update_operational_status("error")
-            return
+                await self._update_operational_status(OPERATIONAL_ERROR)
 
         except Exception as e:
             self.logger.error(f"[CommandHandler] Error handling command: {e}")
             # Send acknowledgment with error if possible (only if cmd_id is available)
-            error_timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+            error_timestamp = _ts.iso_z_now()
             try:
-                partial_data = json.loads(payload)
-                cmd_id = partial_data.get("cmd_id")
+                # The payload already parsed above, so reuse it instead of decoding again
+                cmd_id = data.get("cmd_id")
                 if cmd_id:
                     await self.send_acknowledgment(
                         device_id,
                         cmd_id,
-                        "error",
+                        STATUS_ERROR,
                         error_timestamp,
-                        error_code=MqttErrorCode.INTERNAL_ERROR.value,
-                        error_msg=f"Internal server error: {str(e)}. Please contact support if this persists.",
+                        error_code=ERR_INTERNAL_ERROR,
+                        error_msg=_INTERNAL_ERROR_MSG.format(e),
                     )
 
                     # Update status publisher with error
-                    await self._update_operational_status("error")
+                    await self._update_operational_status(OPERATIONAL_ERROR)
                     return
                 else:
                     # No cmd_id available, send acknowledgment with fallback ID
                     await self.send_acknowledgment(
                         device_id,
                         "unknown",
-                        "error",
+                        STATUS_ERROR,
                         error_timestamp,
-                        error_code=MqttErrorCode.INVALID_PAYLOAD.value,
-                        error_msg="Missing required field 'cmd_id'. Include cmd_id field in command payload.",
+                        error_code=ERR_INVALID_PAYLOAD,
+                        error_msg=_MISSING_CMD_ID_MSG,
                     )
 
                     # Update status publisher with error
-                    await self._update_operational_status("error")
+                    await self._update_operational_status(OPERATIONAL_ERROR)
                     return
-            except json.JSONDecodeError as json_error:
-                # JSON is invalid, send acknowledgment with fallback ID
-                await self.send_acknowledgment(
-                    device_id,
-                    "unknown",
-                    "error",
-                    error_timestamp,
-                    error_code=MqttErrorCode.INVALID_JSON.value,
-                    error_msg=f"Invalid JSON payload: {str(json_error)}. Please check JSON syntax and formatting.",
-                )
-
-                # Update status publisher with error
-                await self._update_operational_status("error")
-                return
             except Exception:
                 # Any other error, just log and update status
                 self.logger.error("[CommandHandler] Failed to handle internal error properly")
-                await self._update_operational_status("error")
+                await self._update_operational_status(OPERATIONAL_ERROR)
 
     async def shutdown(self, timeout: float = 10.0) -> None:
         """Gracefully shutdown the command handler.
@@ -792,6 +975,7 @@ class AsyncCommandHandler:
             del self.commands[command_name]
             if command_name in self.command_schemas:
                 del self.command_schemas[command_name]
+            self._compiled_schemas.pop(command_name, None)
             self.logger.info(f"Unregistered command handler: {command_name}")
 
     # --- Example Command Functions (can be sync or async) ---
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import os
 import sys
 from collections.abc import Awaitable
@@ -7,6 +8,9 @@ from typing import Any, Callable, Optional, Union
 from mqtt_connector import MqttConnector
 from mqtt_logger import MqttLogger
 
+from . import _json
+from ._log import debug_enabled
+
 
 class MqttConnectionManager:
     """Manages a single MQTT connection shared across components."""
@@ -40,35 +44,43 @@ class MqttConnectionManager:
         except RuntimeError:
             self._event_loop = None
 
-        self._connector = MqttConnector(
-            mqtt_broker=broker,
-            mqtt_port=port,
-            client_id=client_id or f"mqtt_manager_{id(self)}",
-            reconnect_interval=reconnect_interval,
-            max_reconnect_attempts=max_reconnect_attempts,
-        )
+        # The connector (and its paho client) is only built on first use
+        self._connector_kwargs = {
+            "mqtt_broker": broker,
+            "mqtt_port": port,
+            "client_id": client_id or f"mqtt_manager_{id(self)}",
+            "reconnect_interval": reconnect_interval,
+            "max_reconnect_attempts": max_reconnect_attempts,
+        }
+
+        # Track message callbacks for different topics
+        self._message_callbacks: dict[str, Callable] = {}
+        self._subscribed_topics = set()
+
+    @functools.cached_property
+    def _connector(self) -> MqttConnector:
+        """The underlying MQTT connector, created on first access."""
+        connector = MqttConnector(**self._connector_kwargs)
 
         # Set up logging callback
-        self._connector.set_log_callback(self._handle_connector_log)
+        connector.set_log_callback(self._handle_connector_log)
 
         # Patch the connector's async scheduling to use our stored event loop
         if self._event_loop:
-            self._patch_connector_async_scheduling()
+            self._patch_connector_async_scheduling(connector)
 
-        # Track message callbacks for different topics
-        self._message_callbacks: dict[str, Callable] = {}
-        self._subscribed_topics = set()
+        return connector
 
-    def _patch_connector_async_scheduling(self) -> None:
+    def _patch_connector_async_scheduling(self, connector: MqttConnector) -> None:
         """Patch the connector's async callback scheduling to use our stored event loop."""
-        original_schedule = self._connector._schedule_async_callback
+        original_schedule = connector._schedule_async_callback
 
         def patched_schedule(topic: str, message: str) -> None:
             """Schedule an async callback using our stored event loop."""
             if self._event_loop:
                 try:
                     self._event_loop.call_soon_threadsafe(
-                        lambda: asyncio.create_task(self._connector._message_callback(topic, message))
+                        lambda: asyncio.create_task(connector._message_callback(topic, message))
                     )
                 except Exception as e:
                     self.logger.error(f"Error scheduling async callback for topic {topic}: {e}")
@@ -76,12 +88,14 @@ class MqttConnectionManager:
                 # Fallback to original method
                 original_schedule(topic, message)
 
-        self._connector._schedule_async_callback = patched_schedule
+        connector._schedule_async_callback = patched_schedule
 
     @property
     def is_connected(self) -> bool:
         """Check if the MQTT connection is active."""
-        return hasattr(self._connector, "connected") and self._connector.connected
+        # Don't build the connector just to report that it isn't connected
+        connector = self.__dict__.get("_connector")
+        return connector is not None and hasattr(connector, "connected") and connector.connected
 
     def _handle_connector_log(self, level: str, message: str) -> None:
         """Handle log messages from the MQTT connector.
@@ -161,8 +175,10 @@ class MqttConnectionManager:
         if len(topic_parts) != len(pattern_parts):
             return False
 
+        log_parts = debug_enabled(self.logger)
         for i, (t_part, p_part) in enumerate(zip(topic_parts, pattern_parts)):
-            self.logger.debug(f"Comparing topic part '{t_part}' with pattern part '{p_part}' at position {i}")
+            if log_parts:
+                self.logger.debug(f"Comparing topic part '{t_part}' with pattern part '{p_part}' at position {i}")
             if p_part != "+" and p_part != t_part:
                 return False
 
@@ -224,7 +240,8 @@ class MqttConnectionManager:
 
     async def disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
-        await self._connector.disconnect()
+        if "_connector" in self.__dict__:
+            await self._connector.disconnect()
         self._subscribed_topics.clear()
         self._message_callbacks.clear()
 
@@ -303,13 +320,16 @@ class MqttConnectionManager:
 
         Args:
             topic: Topic to publish to
-            payload: Message payload (will be JSON-encoded if not a string)
+            payload: Message payload; dicts are JSON-encoded to bytes, while str and
+                bytes payloads are handed to the client as-is (already encoded)
             qos: Quality of Service level
             retain: Whether to retain the message
 
         Returns:
             True if publish successful, False otherwise
         """
+        if isinstance(payload, dict):
+            payload = _json.dumps(payload)
         return await self._connector.publish(topic, payload, qos, retain)
 
     async def publish_with_retry(
@@ -325,7 +345,7 @@ class MqttConnectionManager:
 
         Args:
             topic: Topic to publish to
-            payload: Message payload
+            payload: Message payload; dicts are JSON-encoded once, before the first attempt
             qos: Quality of Service level
             retain: Whether to retain the message
             max_retries: Maximum number of retry attempts
@@ -334,6 +354,8 @@ class MqttConnectionManager:
         Returns:
             True if publish successful, False otherwise
         """
+        # Encode once up front so every attempt reuses the same bytes
+        message = _json.dumps(payload) if isinstance(payload, dict) else payload
         for attempt in range(max_retries):
             try:
                 # Ensure connection is established
@@ -344,13 +366,14 @@ class MqttConnectionManager:
                         raise RuntimeError("MQTT not connected")
 
                 # Try to publish
-                result = await self.publish(topic, payload, qos, retain)
+                result = await self.publish(topic, message, qos, retain)
                 if result:
                     # Log command publishing more prominently
                     if "/cmd/" in topic:
                         self.logger.info(f"📤 Command published to {topic}")
-                        self.logger.debug(f"Command payload: {payload}")
-                    else:
+                        if debug_enabled(self.logger):
+                            self.logger.debug(f"Command payload: {payload}")
+                    elif debug_enabled(self.logger):
                         self.logger.debug(f"Published to {topic} (attempt {attempt + 1})")
                     return True
                 else:
@@ -367,6 +390,35 @@ class MqttConnectionManager:
         self.logger.error(f"Failed to publish to {topic} after {max_retries} attempts")
         return False
 
+    async def publish_many(self, messages: list[tuple[str, Any]], qos: int = 0, retain: bool = False) -> bool:
+        """Publish several messages back to back.
+
+        The connection is checked once for the whole batch. Any message that
+        fails to publish is retried individually via publish_with_retry.
+
+        Args:
+            messages: List of (topic, payload) tuples, published in order
+            qos: Quality of Service level
+            retain: Whether to retain the messages
+
+        Returns:
+            True if all messages were published, False otherwise
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        all_published = True
+        for topic, payload in messages:
+            try:
+                result = await self.publish(topic, payload, qos, retain)
+            except Exception as e:
+                self.logger.warning(f"Publish error for {topic}: {e}")
+                result = False
+            if not result:
+                result = await self.publish_with_retry(topic, payload, qos, retain)
+            all_published = all_published and result
+        return all_published
+
     def register_callback(
         self,
         topic_pattern: str,
@@ -1,14 +1,33 @@
 """Periodic status publisher for MQTT device status messages."""
 
 import asyncio
-import json
-from datetime import datetime, timezone
-from typing import Any, Optional
+import functools
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 
 from mqtt_logger import MqttLogger
 
+from . import _json, _ts
+from ._constants import OPERATIONAL_ERROR, OPERATIONAL_IDLE, OPERATIONAL_STATUSES
+from ._log import debug_enabled
 from .connection_manager import MqttConnectionManager
 
+# Validation error message templates
+_TYPE_MISMATCH_MSG = "Field '{}' expected {}, got {}"
+_MISSING_KEY_MSG = "Field '{}' missing required key '{}'"
+
+# Marks a field absent from the last published status
+_MISSING = object()
+
+# Names of the types status values usually have, for building error messages
+_TYPE_NAMES = {float: "float", int: "int", bool: "bool", str: "str", dict: "dict", list: "list"}
+
+# Updates touching at most 1/4 of the configured fields go straight to the
+# validator: per field it costs roughly 4x the generated check, which always
+# walks every configured field
+_PARTIAL_UPDATE_RATIO = 4
+
 
 class StatusValidationError(Exception):
     """Raised when status payload validation fails."""
@@ -16,6 +35,187 @@ class StatusValidationError(Exception):
     pass
 
 
+def _type_name(value_type: type) -> str:
+    """Return the name of a type as used in validation error messages.
+
+    Args:
+        value_type: The type to name
+
+    Returns:
+        The type's name
+    """
+    return _TYPE_NAMES.get(value_type) or value_type.__name__
+
+
+def _intern(key: Any) -> Any:
+    """Intern a str key, leaving keys of other types unchanged.
+
+    Args:
+        key: A status field name or nested key
+
+    Returns:
+        The interned key
+    """
+    return sys.intern(key) if type(key) is str else key
+
+
+def _extract_defaults(fields: dict[str, Any]) -> dict[str, Any]:
+    """Resolve status field configs to their default values.
+
+    Args:
+        fields: Status payload field definitions from config
+
+    Returns:
+        Field names mapped to their default value ({"default": x} configs unwrapped)
+    """
+    defaults = {}
+    for field_name, field_config in fields.items():
+        # Field names from a parsed config aren't interned; interning them lets
+        # lookups with literal keys from callers match by identity
+        field_name = _intern(field_name)
+        if isinstance(field_config, dict) and "default" in field_config:
+            defaults[field_name] = field_config["default"]
+        else:
+            defaults[field_name] = field_config
+    return defaults
+
+
+@functools.lru_cache(maxsize=16)
+def _format_instant(value: datetime, utcoffset: Optional[timedelta]) -> str:
+    """Format a datetime as ISO 8601 with millisecond precision and a Z suffix for UTC.
+
+    The UTC offset is part of the cache key because datetimes for the same
+    instant in different time zones compare (and hash) equal but format differently.
+
+    Args:
+        value: The datetime to format
+        utcoffset: ``value.utcoffset()``
+
+    Returns:
+        The formatted timestamp
+    """
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _format_command_time(value: datetime) -> str:
+    """Format a command time as ISO 8601 with millisecond precision and a Z suffix.
+
+    The last command time only changes when a command arrives, so it is formatted
+    once and reused by every status payload built until the next command.
+
+    Args:
+        value: The timezone-aware command time
+
+    Returns:
+        The formatted timestamp
+    """
+    return _format_instant(value, value.utcoffset())
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_payload_builder(field_names: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    """Generate a status payload builder specialized for a set of config fields.
+
+    The generated function produces the same payload as
+    ``PeriodicStatusPublisher._build_status_payload`` but emits each config field
+    as a literal key in a single dict display instead of merging dicts.
+
+    Args:
+        field_names: Config status payload field names, in config order
+
+    Returns:
+        A function taking the publisher and returning its status payload
+    """
+    fields = "".join(f"{name!r}: f[{name!r}], " for name in field_names)
+    source = (
+        "def _build_status_payload(self):\n"
+        "    f = self._current_fields\n"
+        "    if self.last_command_time:\n"
+        "        status_data = {'operational_status': self.operational_status, 'timestamp': iso_z_now(), "
+        f"'last_command_time': format_command_time(self.last_command_time), {fields}}}\n"
+        "    else:\n"
+        "        status_data = {'operational_status': self.operational_status, 'timestamp': iso_z_now(), "
+        f"{fields}}}\n"
+        "    if self._extra_fields:\n"
+        "        for field_name, value in self._extra_fields.items():\n"
+        "            if field_name not in status_data:\n"
+        "                status_data[field_name] = value\n"
+        "    return status_data\n"
+    )
+    namespace: dict[str, Any] = {"iso_z_now": _ts.iso_z_now, "format_command_time": _format_command_time}
+    exec(compile(source, "<status payload builder>", "exec"), namespace)
+    return namespace["_build_status_payload"]
+
+
+def _compile_status_schema(
+    fields: dict[str, Any],
+) -> dict[str, tuple[type, Optional[frozenset[str]], Optional[tuple[tuple[str, str, type], ...]]]]:
+    """Compile status field configs into the lookup table used for validation.
+
+    Args:
+        fields: Status payload field definitions from config
+
+    Returns:
+        Field names mapped to (expected_type, required, nested). For dict-valued
+        fields required is the set of configured keys and nested holds
+        (key, dotted_path, expected_type) for each of them; both are None for
+        other fields
+    """
+    schema = {}
+    for field_name, expected_value in _extract_defaults(fields).items():
+        required = nested = None
+        if isinstance(expected_value, dict):
+            required = frozenset(_intern(key) for key in expected_value)
+            nested = tuple((_intern(key), f"{field_name}.{key}", type(value)) for key, value in expected_value.items())
+        schema[field_name] = (type(expected_value), required, nested)
+    return schema
+
+
+def _no_status_check(values: dict[str, Any]) -> bool:
+    """Status check for schemas that can't be compiled; defers to full validation."""
+    return False
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_status_check(
+    schema_items: tuple[
+        tuple[str, tuple[type, Optional[frozenset[str]], Optional[tuple[tuple[str, str, type], ...]]]], ...
+    ],
+) -> Callable[[dict[str, Any]], bool]:
+    """Generate a straight-line check of status values against a compiled schema.
+
+    The generated function only answers whether the values are valid. On False
+    the caller runs ``PeriodicStatusPublisher._validate_status_payload`` to raise
+    the detailed error, so messages and their order are unchanged.
+
+    Args:
+        schema_items: Items of a schema from ``_compile_status_schema``
+
+    Returns:
+        A function taking the status values and returning True if they are valid
+    """
+    namespace: dict[str, Any] = {"_MISSING": _MISSING}
+    lines = ["def _check_status_payload(values):"]
+    for i, (field_name, (expected_type, required, nested)) in enumerate(schema_items):
+        namespace[f"t{i}"] = expected_type
+        lines.append(f"    v = values.get({field_name!r}, _MISSING)")
+        lines.append("    if v is not _MISSING:")
+        lines.append(f"        if type(v) is not t{i} and not isinstance(v, t{i}):")
+        lines.append("            return False")
+        if nested is not None:
+            namespace[f"r{i}"] = required
+            lines.append(f"        if not v.keys() >= r{i}:")
+            lines.append("            return False")
+            for j, (key, _path, key_type) in enumerate(nested):
+                namespace[f"t{i}_{j}"] = key_type
+                lines.append(f"        k = v[{key!r}]")
+                lines.append(f"        if type(k) is not t{i}_{j} and not isinstance(k, t{i}_{j}):")
+                lines.append("            return False")
+    lines.append("    return True")
+    exec(compile("\n".join(lines) + "\n", "<status payload check>", "exec"), namespace)
+    return namespace["_check_status_payload"]
+
+
 class PeriodicStatusPublisher:
     """Publishes system status messages for device topics with intelligent change detection.
 
@@ -58,17 +258,9 @@ class PeriodicStatusPublisher:
         self.namespace = namespace
         self.status_topic = status_topic_pattern.format(namespace=namespace, device_id=device_id)
 
-        # System state tracking
-        self.operational_status = "idle"  # idle, busy, error
-        self.last_command_time: Optional[datetime] = None
         self._is_running = False
         self._task: Optional[asyncio.Task] = None
 
-        # Custom status payload support
-        self.config_status_payload = config_status_payload or {}
-        self.custom_status_values: dict[str, Any] = {}
-        self.status_payload_fields = self.config_status_payload
-
         # Use the provided connection manager
         self.connection_manager = connection_manager
         self._owns_connection = False
@@ -77,9 +269,63 @@ class PeriodicStatusPublisher:
         self.enable_change_only_publishing = True  # Always enabled for efficiency
         self.use_retained_messages = True  # Always enabled for on-demand access
         self.enable_keepalive_publishing = enable_keepalive_publishing  # Configurable
+
+        # System state and custom status payload
+        self.reset(config_status_payload)
+
+    def reset(self, config_status_payload: Optional[dict[str, Any]] = None) -> None:
+        """Reset system state and status payload values to their initial state.
+
+        Lets a stopped publisher be reused with a new status payload config
+        instead of constructing a new one.
+
+        Args:
+            config_status_payload: Status payload field definitions from config
+        """
+        # System state tracking
+        self.operational_status = OPERATIONAL_IDLE  # idle, busy, error
+        self.last_command_time: Optional[datetime] = None
+
+        # Custom status payload support
+        self.config_status_payload = config_status_payload or {}
+        self.custom_status_values: dict[str, Any] = {}
+        self.status_payload_fields = self.config_status_payload
+
+        # Config field defaults overlaid with current values, plus custom values
+        # for fields not in config; both kept up to date in place
+        self._current_fields = _extract_defaults(self.status_payload_fields)
+        self._extra_fields: dict[str, Any] = {}
+
+        # Expected types per field, compiled once for every update to consult
+        self._schema = _compile_status_schema(self.status_payload_fields)
+        if self._schema:
+            # Straight-line check generated for this schema (str keys only)
+            if all(
+                type(field_name) is str and (nested is None or all(type(key) is str for key, _path, _type in nested))
+                for field_name, (_type, _required, nested) in self._schema.items()
+            ):
+                self._check_status_payload = _compile_status_check(tuple(self._schema.items()))
+            else:
+                self._check_status_payload = _no_status_check
+        else:
+            self._check_status_payload = _no_status_check
+
+        # The config shape is fixed from here on, so use a builder specialized
+        # for its fields; without config (or with non-str keys) keep the generic one
+        field_names = tuple(self._current_fields)
+        self._payload_builder: Optional[Callable[[Any], dict[str, Any]]] = None
+        if field_names and all(type(name) is str for name in field_names):
+            self._payload_builder = _compile_payload_builder(field_names)
+
+        # Publish tracking
         self._last_published_status: Optional[dict[str, Any]] = None
         self._pending_immediate_publish = False
 
+        # Set when status values change; with the operational status and command
+        # time seen at the last publish, lets an unchanged tick skip building
+        self._dirty = True
+        self._published_state: Optional[tuple[str, Optional[datetime]]] = None
+
     def update_status_payload(self, values: dict[str, Any]) -> None:
         """Update the entire status payload with new values.
 
@@ -90,13 +336,46 @@ class PeriodicStatusPublisher:
         Raises:
             StatusValidationError: If the values don't match the config schema
         """
-        self._validate_status_payload(values)
-        old_values = self.custom_status_values.copy()
-        self.custom_status_values.update(values)
-        self.logger.debug(f"Status payload updated with: {values}")
+        # Without a schema there is nothing to validate
+        schema = self._schema
+        if schema:
+            if len(values) * _PARTIAL_UPDATE_RATIO <= len(schema):
+                # Small update: the validator walks just the updated fields
+                self._validate_status_payload(values)
+            elif not self._check_status_payload(values):
+                # The generated check only says pass/fail; the validator raises the detailed error
+                self._validate_status_payload(values)
+        self._apply_status_values(values)
+
+    def _apply_status_values(self, values: dict[str, Any]) -> None:
+        """Store already validated status values and flag a publish if they changed.
+
+        Args:
+            values: Dictionary containing field names and their current values
+        """
+        current = self.custom_status_values
+        changed = any(field_name not in current or current[field_name] != value for field_name, value in values.items())
+        current.update(values)
+
+        # Updates usually touch only config fields or only extra fields, which a
+        # key-set comparison settles with a single update instead of per-key routing
+        current_fields = self._current_fields
+        if current_fields.keys() >= values.keys():
+            current_fields.update(values)
+        elif current_fields.keys().isdisjoint(values):
+            self._extra_fields.update(values)
+        else:
+            for field_name, value in values.items():
+                if field_name in current_fields:
+                    current_fields[field_name] = value
+                else:
+                    self._extra_fields[field_name] = value
+        if debug_enabled(self.logger):
+            self.logger.debug(f"Status payload updated with: {values}")
 
         # Trigger immediate publish if values changed
-        if old_values != self.custom_status_values:
+        if changed:
+            self._dirty = True
             self._pending_immediate_publish = True
             self.logger.debug("Status change detected, immediate publish triggered")
 
@@ -109,107 +388,58 @@ class PeriodicStatusPublisher:
         Raises:
             StatusValidationError: If validation fails
         """
-        if not self.status_payload_fields:
+        schema = self._schema
+        if not schema:
             # No config schema defined, accept any values
             return
 
         for field_name, field_value in values.items():
-            if field_name in self.status_payload_fields:
-                expected_config = self.status_payload_fields[field_name]
-                try:
-                    self._validate_field_type(field_name, field_value, expected_config)
-                except StatusValidationError:
-                    raise
-            # Allow fields not in config for flexibility (as per current behavior)
-
-    def _validate_field_type(self, field_name: str, field_value: Any, expected_config: Any) -> None:
-        """Validate that a field value matches the expected type from config.
-
-        Args:
-            field_name: Name of the field being validated
-            field_value: The actual value to validate
-            expected_config: The expected configuration (type or structure)
-
-        Raises:
-            StatusValidationError: If the field type doesn't match
-        """
-        # Handle default value configs - extract the default for type checking
-        if isinstance(expected_config, dict) and "default" in expected_config:
-            expected_value = expected_config["default"]
-        else:
-            expected_value = expected_config
-
-        # Get the expected type from the config value
-        expected_type = type(expected_value)
-
-        # Validate basic type compatibility
-        if not isinstance(field_value, expected_type):
-            raise StatusValidationError(
-                f"Field '{field_name}' expected {expected_type.__name__}, " f"got {type(field_value).__name__}"
-            )
-
-        # Additional validation for complex types
-        if isinstance(expected_value, dict) and isinstance(field_value, dict):
-            self._validate_dict_structure(field_name, field_value, expected_value)
-
-    def _validate_dict_structure(
-        self,
-        field_name: str,
-        field_value: dict[str, Any],
-        expected_structure: dict[str, Any],
-    ) -> None:
-        """Validate that a dictionary field matches the expected structure.
-
-        Args:
-            field_name: Name of the field being validated
-            field_value: The actual dictionary value
-            expected_structure: The expected dictionary structure
-
-        Raises:
-            StatusValidationError: If the structure doesn't match
-        """
-        # Check for required keys based on config structure
-        for key, expected_val in expected_structure.items():
-            if key not in field_value:
-                raise StatusValidationError(f"Field '{field_name}' missing required key '{key}'")
-
-            # Recursively validate nested structures
-            actual_val = field_value[key]
-            expected_type = type(expected_val)
-
-            if not isinstance(actual_val, expected_type):
+            compiled = schema.get(field_name)
+            if compiled is None:
+                # Allow fields not in config for flexibility (as per current behavior)
+                continue
+
+            # Exact type match is the common case; isinstance only covers subclasses
+            expected_type, required, nested = compiled
+            if type(field_value) is not expected_type and not isinstance(field_value, expected_type):
                 raise StatusValidationError(
-                    f"Field '{field_name}.{key}' expected {expected_type.__name__}, " f"got {type(actual_val).__name__}"
+                    _TYPE_MISMATCH_MSG.format(field_name, _type_name(expected_type), _type_name(type(field_value)))
                 )
 
+            # Dict fields must carry every configured key with a matching type
+            if nested is not None:
+                if not field_value.keys() >= required:
+                    # Report the first missing key in config order
+                    missing = next(key for key, _path, _key_type in nested if key not in field_value)
+                    raise StatusValidationError(_MISSING_KEY_MSG.format(field_name, missing))
+                for key, path, key_type in nested:
+                    actual_val = field_value[key]
+                    if type(actual_val) is not key_type and not isinstance(actual_val, key_type):
+                        raise StatusValidationError(
+                            _TYPE_MISMATCH_MSG.format(path, _type_name(key_type), _type_name(type(actual_val)))
+                        )
+
     def _build_status_payload(self) -> dict[str, Any]:
         """Build the complete status payload using config fields and current values."""
+        builder = self._payload_builder
+        if builder is not None:
+            return builder(self)
+
         # Start with default operational status
         status_data = {
             "operational_status": self.operational_status,
-            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "timestamp": _ts.iso_z_now(),
         }
 
         # Add last_command_time if available
         if self.last_command_time:
-            status_data["last_command_time"] = self.last_command_time.isoformat(timespec="milliseconds").replace(
-                "+00:00", "Z"
-            )
+            status_data["last_command_time"] = _format_command_time(self.last_command_time)
 
-        # Add custom fields from config
-        for field_name, field_config in self.status_payload_fields.items():
-            if field_name in self.custom_status_values:
-                # Use current value
-                status_data[field_name] = self.custom_status_values[field_name]
-            elif isinstance(field_config, dict) and "default" in field_config:
-                # Use default value from config
-                status_data[field_name] = field_config["default"]
-            else:
-                # Use config value directly as default
-                status_data[field_name] = field_config
+        # Add config fields (current value or default)
+        status_data.update(self._current_fields)
 
         # Add any custom status values that aren't in config (for flexibility)
-        for field_name, value in self.custom_status_values.items():
+        for field_name, value in self._extra_fields.items():
             if field_name not in status_data:
                 status_data[field_name] = value
 
@@ -221,10 +451,11 @@ class PeriodicStatusPublisher:
         Args:
             status: The new operational status ('idle', 'busy', 'error')
         """
-        if status in ["idle", "busy", "error"]:
+        if status in OPERATIONAL_STATUSES:
             old_status = self.operational_status
             self.operational_status = status
-            self.logger.debug(f"Operational status updated to: {status}")
+            if debug_enabled(self.logger):
+                self.logger.debug(f"Operational status updated to: {status}")
 
             # Trigger immediate publish for significant status changes
             if old_status != status:
@@ -247,14 +478,21 @@ class PeriodicStatusPublisher:
         Returns:
             True if status has changed, False otherwise
         """
-        if self._last_published_status is None:
+        last_status = self._last_published_status
+        if last_status is None:
             return True  # Always publish the first status
 
-        # Compare status excluding timestamp (which always changes)
-        current_without_timestamp = {k: v for k, v in current_status.items() if k != "timestamp"}
-        last_without_timestamp = {k: v for k, v in self._last_published_status.items() if k != "timestamp"}
-
-        return current_without_timestamp != last_without_timestamp
+        # Compare status excluding timestamp (which always changes) in one pass,
+        # without building timestamp-free copies of both payloads
+        if len(current_status) - ("timestamp" in current_status) != len(last_status) - ("timestamp" in last_status):
+            return True
+        for key, value in current_status.items():
+            if key == "timestamp":
+                continue
+            last_value = last_status.get(key, _MISSING)
+            if last_value is not value and last_value != value:
+                return True
+        return False
 
     async def publish_immediately(self) -> None:
         """Publish status immediately, bypassing change detection.
@@ -270,8 +508,23 @@ class PeriodicStatusPublisher:
             force: Force publish even if status hasn't changed
         """
         try:
+            # Nothing changed since the last publish, so skip building a payload
+            # that change detection would only discard
+            if (
+                not force
+                and self.enable_change_only_publishing
+                and not self._pending_immediate_publish
+                and not self._dirty
+                and self._published_state == (self.operational_status, self.last_command_time)
+            ):
+                if debug_enabled(self.logger):
+                    self.logger.debug("Status publish skipped: status unchanged since last publish")
+                return
+
             # Build status payload with custom fields
             status_data = self._build_status_payload()
+            self._dirty = False
+            built_state = (self.operational_status, self.last_command_time)
 
             # Check if we should publish based on change detection and settings
             status_changed = self._status_changed(status_data)
@@ -284,14 +537,16 @@ class PeriodicStatusPublisher:
                 or has_pending_changes  # Immediate publish requested
             )
 
-            # Log decision for debugging
-            if not should_publish:
-                self.logger.debug(
-                    f"Status publish skipped: change_only={self.enable_change_only_publishing}, "
-                    f"changed={status_changed}, pending={has_pending_changes}, force={force}"
-                )
-
             if not should_publish:
+                # Status matches the last published one
+                self._published_state = built_state
+
+                # Log decision for debugging
+                if debug_enabled(self.logger):
+                    self.logger.debug(
+                        f"Status publish skipped: change_only={self.enable_change_only_publishing}, "
+                        f"changed={status_changed}, pending={has_pending_changes}, force={force}"
+                    )
                 return
 
             # Connect if not already connected
@@ -304,17 +559,23 @@ class PeriodicStatusPublisher:
             )
 
             # Update tracking
-            self._last_published_status = status_data.copy()
+            # status_data is built fresh for each publish, so it can be kept as is
+            self._last_published_status = status_data
+            self._published_state = built_state
             self._pending_immediate_publish = False
 
-            retention_info = " (retained)" if self.use_retained_messages else ""
-            self.logger.debug(f"Status published to {self.status_topic}{retention_info}: {json.dumps(status_data)}")
+            if debug_enabled(self.logger):
+                retention_info = " (retained)" if self.use_retained_messages else ""
+                self.logger.debug(
+                    f"Status published to {self.status_topic}{retention_info}: {_json.dumps(status_data).decode()}"
+                )
 
         except Exception as e:
             self.logger.error(f"Error publishing status: {str(e)}")
+            self._dirty = True
             # Set error status if not already set
-            if self.operational_status != "error":
-                self.operational_status = "error"
+            if self.operational_status != OPERATIONAL_ERROR:
+                self.operational_status = OPERATIONAL_ERROR
 
     async def _status_loop(self) -> None:
         """Main status publishing loop with change detection and optional keep-alive."""
@@ -352,7 +613,7 @@ class PeriodicStatusPublisher:
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error in status loop: {str(e)}")
-            self.operational_status = "error"
+            self.operational_status = OPERATIONAL_ERROR
         finally:
             self.logger.info("Status publisher loop ended")
 
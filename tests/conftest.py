@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for MQTT client tests."""
 
 import asyncio
+import logging
 import os
 import tempfile
 
@@ -25,9 +26,21 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as an integration test")
 
 
-@pytest_asyncio.fixture
+def pytest_collection_modifyitems(items):
+    """Run every async test on the shared session event loop.
+
+    Async fixtures declare loop_scope="session" as well, so objects that capture
+    the running loop (e.g. MqttConnectionManager) see the loop the test runs on.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def mqtt_logger():
-    """Create a real MqttLogger instance for testing."""
+    """Create a real MqttLogger instance shared by the whole test session."""
     logger = MqttLogger(
         mqtt_broker="test.mosquitto.org",
         mqtt_port=1883,
@@ -56,7 +69,34 @@ async def mqtt_logger():
         pass
 
 
-@pytest_asyncio.fixture
+class NullMqttLogger:
+    """MqttLogger test double that discards every message without file or network I/O."""
+
+    log_level = logging.INFO
+
+    def debug(self, message, data=None):
+        pass
+
+    def info(self, message, data=None):
+        pass
+
+    def warning(self, message, data=None):
+        pass
+
+    def error(self, message, data=None):
+        pass
+
+    def critical(self, message, data=None):
+        pass
+
+
+@pytest.fixture(scope="session")
+def null_logger():
+    """Logger for unit tests that don't inspect log output."""
+    return NullMqttLogger()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def mqtt_connector():
     """Create a real MqttConnector instance for testing."""
     connector = MqttConnector(mqtt_broker="test.mosquitto.org", mqtt_port=1883, client_id="test_client")
@@ -126,7 +166,7 @@ def sample_mqtt_message():
     }
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def connection_manager(mqtt_logger):
     """Create a shared MqttConnectionManager instance for testing."""
     manager = MqttConnectionManager(
@@ -147,7 +187,7 @@ async def connection_manager(mqtt_logger):
         pass
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def command_handler(mqtt_logger, connection_manager):
     """Create an AsyncCommandHandler instance for testing."""
     handler = AsyncCommandHandler(logger=mqtt_logger, connection_manager=connection_manager)
@@ -156,7 +196,7 @@ async def command_handler(mqtt_logger, connection_manager):
     # Cleanup is handled by the connection_manager fixture
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def status_publisher(mqtt_logger, connection_manager, config_instance):
     """Create a PeriodicStatusPublisher instance for testing."""
     # Get status payload from config (this would typically be in the YAML)
@@ -173,7 +213,30 @@ async def status_publisher(mqtt_logger, connection_manager, config_instance):
     # Cleanup is handled by the connection_manager fixture
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="module")
+def pooled_status_publisher(null_logger):
+    """PeriodicStatusPublisher shared by a test module; never started, reset per use."""
+    manager = MqttConnectionManager(
+        broker="test.mosquitto.org",
+        port=1883,
+        logger=null_logger,
+        client_id="test_pooled_status_publisher",
+    )
+    return PeriodicStatusPublisher(device_id="test_device", logger=null_logger, connection_manager=manager)
+
+
+@pytest.fixture
+def status_publisher_factory(pooled_status_publisher):
+    """Hand out the pooled status publisher, reset to the given status payload config."""
+
+    def factory(config_status_payload=None):
+        pooled_status_publisher.reset(config_status_payload)
+        return pooled_status_publisher
+
+    return factory
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def mqtt_client(mqtt_logger, message_queue, connection_manager):
     """Create an AsyncMqttClient instance for testing."""
     client = AsyncMqttClient(
@@ -192,7 +255,7 @@ async def mqtt_client(mqtt_logger, message_queue, connection_manager):
 # ============================================================================
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def trackable_connection_manager(connection_manager):
     """Connection manager that allows method tracking for tests."""
     from unittest.mock import AsyncMock
@@ -201,10 +264,44 @@ async def trackable_connection_manager(connection_manager):
     connection_manager.publish = AsyncMock()
     # Mock the underlying connector's connected property for connection state
     connection_manager._connector.connected = True
-    return connection_manager
+    yield connection_manager
+    # Never actually connected - reset so teardown doesn't wait on a disconnect
+    connection_manager._connector.connected = False
+
+
+class RecordingPublisher:
+    """Lightweight connection manager stand-in that records every publish.
+
+    Cheaper than an AsyncMock for tests that publish many messages and only
+    need to inspect what was sent.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    async def publish(self, topic, payload, qos=0, retain=False):
+        self.calls.append((topic, payload))
+        return True
+
+
+@pytest.fixture
+def recording_handler_factory(mqtt_logger):
+    """Factory for independent command handlers, each with its own RecordingPublisher.
+
+    Lets a test run several scenarios concurrently and still inspect each
+    scenario's publishes separately.
+    """
+
+    def make_handler():
+        recorder = RecordingPublisher()
+        return AsyncCommandHandler(logger=mqtt_logger, connection_manager=recorder), recorder
+
+    return make_handler
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def trackable_command_handler(mqtt_logger, trackable_connection_manager):
     """Command handler that allows method tracking."""
     handler = AsyncCommandHandler(logger=mqtt_logger, connection_manager=trackable_connection_manager)
@@ -212,7 +309,7 @@ async def trackable_command_handler(mqtt_logger, trackable_connection_manager):
     return handler
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def trackable_status_publisher(status_publisher):
     """Status publisher that allows method tracking for tests."""
     from unittest.mock import MagicMock
@@ -0,0 +1,103 @@
+"""In-process stand-ins for the MQTT broker connection and logger.
+
+Lets tests drive a full MqttApplication without network access: published
+messages are delivered to matching subscribers on the running event loop and
+recorded for inspection, and log records are kept in memory.
+"""
+
+import asyncio
+import inspect
+import json
+
+
+def topic_matches(topic, pattern):
+    """Check if a topic matches a subscription pattern with MQTT wildcards."""
+    topic_parts = topic.split("/")
+    pattern_parts = pattern.split("/")
+    if pattern_parts[-1] == "#":
+        pattern_parts = pattern_parts[:-1]
+        if len(topic_parts) < len(pattern_parts):
+            return False
+        topic_parts = topic_parts[: len(pattern_parts)]
+    elif len(topic_parts) != len(pattern_parts):
+        return False
+    return all(p == "+" or p == t for t, p in zip(topic_parts, pattern_parts))
+
+
+class InProcessBroker:
+    """Drop-in replacement for MqttConnectionManager backed by in-memory channels."""
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self._callbacks = {}
+        self._connected = False
+
+    @property
+    def is_connected(self):
+        return self._connected
+
+    async def connect(self):
+        self._connected = True
+        return True
+
+    async def disconnect(self):
+        self._connected = False
+        self._callbacks.clear()
+
+    async def subscribe(self, topic, callback):
+        self._callbacks[topic] = callback
+        return True
+
+    def register_callback(self, topic_pattern, callback):
+        self._callbacks[topic_pattern] = callback
+
+    async def unsubscribe(self, topic):
+        self._callbacks.pop(topic, None)
+        return True
+
+    def get_registered_callbacks(self):
+        return dict(self._callbacks)
+
+    async def publish(self, topic, payload, qos=0, retain=False):
+        self.messages.put_nowait((topic, payload))
+        wire_payload = json.dumps(payload) if isinstance(payload, dict) else payload
+        for pattern, callback in list(self._callbacks.items()):
+            if topic_matches(topic, pattern):
+                result = callback(topic, wire_payload, None)
+                if inspect.isawaitable(result):
+                    await result
+        return True
+
+    async def publish_with_retry(self, topic, payload, qos=1, retain=False, max_retries=3, base_delay=0.5):
+        return await self.publish(topic, payload, qos, retain)
+
+
+class InProcessLogger:
+    """Stand-in for MqttLogger that keeps log records in memory instead of publishing them."""
+
+    def __init__(self):
+        self.records = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    def _log(self, level, message, data=None):
+        self.records.append((level, message))
+
+    def debug(self, message, data=None):
+        self._log("DEBUG", message, data)
+
+    def info(self, message, data=None):
+        self._log("INFO", message, data)
+
+    def warning(self, message, data=None):
+        self._log("WARNING", message, data)
+
+    def error(self, message, data=None):
+        self._log("ERROR", message, data)
+
+    def critical(self, message, data=None):
+        self._log("CRITICAL", message, data)
@@ -1,10 +1,15 @@
 """Tests for the callback registration feature in MqttConnectionManager."""
 
 import asyncio
+import json
+from datetime import datetime, timezone
 from typing import Any, Optional
+from unittest.mock import AsyncMock
 
 import pytest
 
+from mqtt_application import _json
+
 
 class TestCallbackRegistration:
     """Test callback registration functionality."""
@@ -299,3 +304,55 @@ class TestCallbackRegistration:
         # Simulate message (should not trigger callback since callback was removed)
         await manager._global_message_callback("test/unsub", "after unsub")
         assert len(callback_calls) == 1  # Still only 1 call
+
+    def test_connector_created_lazily(self, connection_manager):
+        """Test that the MQTT connector is only built when first needed."""
+        manager = connection_manager
+
+        assert manager.is_connected is False
+        assert "_connector" not in manager.__dict__
+
+        connector = manager._connector
+        assert connector.mqtt_broker == "test.mosquitto.org"
+        assert connector.client_id == "test_connection_manager"
+        assert manager._connector is connector
+
+    @pytest.mark.asyncio
+    async def test_connection_manager_uses_test_event_loop(self, connection_manager):
+        """Test that the fixture's captured event loop is the one the test runs on."""
+        assert connection_manager._event_loop is asyncio.get_running_loop()
+
+    @pytest.mark.asyncio
+    async def test_publish_with_retry_encodes_payload_once(self, connection_manager):
+        """Test that publish_with_retry encodes a dict payload once and reuses the bytes on every attempt."""
+        manager = connection_manager
+        manager.connect = AsyncMock(return_value=True)
+        manager._connector.connected = True
+        manager.publish = AsyncMock(side_effect=[False, False, True])
+        try:
+            result = await manager.publish_with_retry("icsia/test/status", {"value": 1}, base_delay=0)
+        finally:
+            manager._connector.connected = False
+
+        assert result is True
+        first, second, third = manager.publish.call_args_list
+        assert json.loads(first[0][1]) == {"value": 1}
+        assert second[0][1] is first[0][1]
+        assert third[0][1] is first[0][1]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_encoding_does_not_depend_on_orjson(self, monkeypatch, use_orjson):
+        """Test that NaN, infinities and datetimes encode the same with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(_json, "orjson", None)
+
+        sent_at = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        payload = {"position": float("nan"), "limits": [float("-inf"), 1.5], "sent_at": sent_at}
+
+        assert json.loads(_json.dumps(payload)) == {
+            "position": None,
+            "limits": [None, 1.5],
+            "sent_at": "2025-01-01 12:00:00+00:00",
+        }
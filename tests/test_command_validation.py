@@ -22,9 +22,14 @@ Key validation rules tested:
 - Type validation matches configuration examples
 """
 
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
 import pytest
 
-from mqtt_application.command_handler import CommandValidationError
+from mqtt_application import _json
+from mqtt_application.command_handler import AsyncCommandHandler, CommandValidationError
 
 
 def test_command_validation_basic_types(trackable_command_handler):
@@ -208,6 +213,24 @@ def test_command_validation_with_defaults(trackable_command_handler):
     assert enriched["priority"] == 1
 
 
+def test_unregister_command_drops_compiled_schema(trackable_command_handler):
+    """Test that unregistering a command evicts its compiled schema and a new schema is recompiled."""
+    handler = trackable_command_handler
+    handler.register_command("configure", lambda data: None)
+    handler.command_schemas = {"configure": {"speed": 1}}
+
+    handler.validate_command_payload("configure", {"speed": 5})
+    assert "configure" in handler._compiled_schemas
+
+    handler.unregister_command("configure")
+    assert "configure" not in handler._compiled_schemas
+
+    handler.register_command("configure", lambda data: None)
+    handler.command_schemas["configure"] = {"speed": "fast"}
+    with pytest.raises(CommandValidationError, match="expected str"):
+        handler.validate_command_payload("configure", {"speed": 5})
+
+
 def test_command_validation_no_schema(trackable_command_handler):
     """Test that commands without schemas are allowed."""
     command_config = {}
@@ -698,9 +721,6 @@ def test_command_validation_edge_cases_and_boundaries(trackable_command_handler)
 
 def test_standard_fields_validation_in_handle_command(trackable_command_handler, trackable_connection_manager):
     """Test that handle_command validates standard fields (command, cmd_id) presence."""
-    import asyncio
-    import json
-
     command_config = {"test_cmd": {"value": 42}}  # Simple required field
 
     # Use trackable fixtures
@@ -724,7 +744,7 @@ def test_standard_fields_validation_in_handle_command(trackable_command_handler,
         # Should send error acknowledgment via publish call
         assert connection_manager.publish.called
         call_args = connection_manager.publish.call_args
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["error_code"] == "INVALID_PAYLOAD"
         assert (
             payload["error_msg"]
@@ -748,7 +768,7 @@ def test_standard_fields_validation_in_handle_command(trackable_command_handler,
         # Should send error acknowledgment via publish call
         assert connection_manager.publish.called
         call_args = connection_manager.publish.call_args
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["error_code"] == "INVALID_PAYLOAD"
         assert payload["error_msg"] == "Missing required field 'cmd_id'. Include cmd_id field in command payload."
 
@@ -763,7 +783,7 @@ def test_standard_fields_validation_in_handle_command(trackable_command_handler,
         # Should send error acknowledgment
         assert connection_manager.publish.called
         call_args = connection_manager.publish.call_args
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["error_code"] == "INVALID_PAYLOAD"
 
         connection_manager.publish.reset_mock()
@@ -775,7 +795,7 @@ def test_standard_fields_validation_in_handle_command(trackable_command_handler,
         # Should send error acknowledgment
         assert connection_manager.publish.called
         call_args = connection_manager.publish.call_args
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["error_code"] == "INVALID_PAYLOAD"
 
     # Run the async tests using asyncio.run for each
@@ -851,7 +871,7 @@ async def test_error_code_consistency(trackable_command_handler, trackable_conne
     # Check that publish was called with INVALID_JSON error code
     assert connection_manager.publish.called
     call_args = connection_manager.publish.call_args
-    payload = call_args[0][1]
+    payload = json.loads(call_args[0][1])
     assert payload["error_code"] == "INVALID_JSON"
     assert (
         "Invalid JSON payload:" in payload["error_msg"]
@@ -867,7 +887,7 @@ async def test_error_code_consistency(trackable_command_handler, trackable_conne
     # Check that publish was called with INVALID_PAYLOAD error code
     assert connection_manager.publish.called
     call_args = connection_manager.publish.call_args
-    payload = call_args[0][1]
+    payload = json.loads(call_args[0][1])
     assert payload["error_code"] == "INVALID_PAYLOAD"
     assert payload["error_msg"] == "Missing required field 'cmd_id'. Include cmd_id field in command payload."
 
@@ -880,7 +900,7 @@ async def test_error_code_consistency(trackable_command_handler, trackable_conne
     # Check error code
     assert connection_manager.publish.called
     call_args = connection_manager.publish.call_args
-    payload = call_args[0][1]
+    payload = json.loads(call_args[0][1])
     assert payload["error_code"] == "INVALID_PAYLOAD"
     assert (
         payload["error_msg"]
@@ -906,6 +926,79 @@ async def test_error_code_consistency(trackable_command_handler, trackable_conne
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload", [42, {"command": "test"}])
+async def test_non_text_payload_is_invalid_json_without_orjson(
+    trackable_command_handler, trackable_connection_manager, monkeypatch, payload
+):
+    """Test that non-str/bytes payloads get an INVALID_JSON ack when orjson is not installed."""
+    monkeypatch.setattr(_json, "orjson", None)
+
+    await trackable_command_handler.handle_command("icsia/test_device/cmd/test", payload)
+
+    assert trackable_connection_manager.publish.called
+    ack = json.loads(trackable_connection_manager.publish.call_args[0][1])
+    assert ack["status"] == "error"
+    assert ack["error_code"] == "INVALID_JSON"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_command_cleans_up_pending_acknowledgment(
+    trackable_command_handler, trackable_connection_manager
+):
+    """Test that cancelling a command also cancels and awaits its in-flight acknowledgment."""
+    handler = trackable_command_handler
+    ack_started = asyncio.Event()
+    ack_tasks = []
+
+    async def slow_publish(*args, **kwargs):
+        ack_tasks.append(asyncio.current_task())
+        ack_started.set()
+        await asyncio.Event().wait()
+
+    async def blocking_command(data):
+        await asyncio.Event().wait()
+
+    trackable_connection_manager.publish.side_effect = slow_publish
+    handler.register_command("block_test", blocking_command)
+
+    command = asyncio.create_task(
+        handler.handle_command("icsia/test_device/cmd/block_test", '{"cmd_id": "test_123", "data": {}}')
+    )
+    await ack_started.wait()
+    command.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await command
+    assert ack_tasks[0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_failed_acknowledgment_is_not_an_execution_error(trackable_command_handler, trackable_connection_manager):
+    """Test that a failed "received" ack is logged and the successful command still completes."""
+    handler = trackable_command_handler
+    published = []
+
+    async def publish_with_retry(topic, payload, qos=1):
+        if topic.endswith("/ack"):
+            raise RuntimeError("ack lost")
+        published.append((topic, payload))
+
+    async def ok_command(data):
+        return None
+
+    trackable_connection_manager.publish_with_retry = publish_with_retry
+    handler.register_command("ok_test", ok_command)
+
+    await handler.handle_command("icsia/test_device/cmd/ok_test", '{"cmd_id": "test_123", "data": {}}')
+
+    assert len(published) == 1
+    topic, completion = published[0]
+    assert topic == "icsia/test_device/status/completion"
+    assert completion["status"] == "completed"
+    assert "error_code" not in completion
+
+
 @pytest.mark.asyncio
 async def test_status_publisher_thread_safety(
     trackable_command_handler, trackable_status_publisher, trackable_connection_manager
@@ -1036,7 +1129,7 @@ async def test_command_execution_error_handling(trackable_command_handler, track
 
     # Check completion (second call) has EXECUTION_ERROR
     completion_call = connection_manager.publish.call_args_list[1]
-    completion_payload = completion_call[0][1]
+    completion_payload = json.loads(completion_call[0][1])
     assert completion_payload["error_code"] == "EXECUTION_ERROR"
     assert (
         "Command execution failed:" in completion_payload["error_msg"]
@@ -1078,6 +1171,53 @@ async def test_command_validation_error_handling(trackable_command_handler, trac
     assert completion_payload["error_code"] == "VALIDATION_ERROR"
 
 
+@pytest.mark.asyncio
+async def test_send_ack_and_completion_batch(trackable_command_handler, trackable_connection_manager):
+    """Test that a batched error response publishes the ack before the completion."""
+    handler = trackable_command_handler
+    connection_manager = trackable_connection_manager
+
+    await handler.send_ack_and_completion(
+        "test_device",
+        "test123",
+        "2024-01-01T00:00:00.000Z",
+        error_code="UNKNOWN_COMMAND",
+        error_msg="Unknown command 'nope'.",
+    )
+
+    assert connection_manager.publish.call_count == 2
+    ack_call, completion_call = connection_manager.publish.call_args_list
+    assert ack_call[0][0] == "icsia/test_device/status/ack"
+    assert ack_call[0][1]["status"] == "received"
+    assert "error_code" not in ack_call[0][1]
+    assert completion_call[0][0] == "icsia/test_device/status/completion"
+    assert completion_call[0][1]["status"] == "error"
+    assert completion_call[0][1]["error_code"] == "UNKNOWN_COMMAND"
+    assert completion_call[0][1]["command_timestamp"] == "2024-01-01T00:00:00.000Z"
+
+
+@pytest.mark.asyncio
+async def test_send_ack_and_completion_retries_without_publish_many(mqtt_logger):
+    """Test that the batched error response keeps the retry path when publish_many is unavailable."""
+
+    class RetryOnlyManager:
+        publish = AsyncMock()
+        publish_with_retry = AsyncMock(return_value=True)
+
+    manager = RetryOnlyManager()
+    handler = AsyncCommandHandler(logger=mqtt_logger, connection_manager=manager)
+
+    await handler.send_ack_and_completion(
+        "test_device", "test123", None, error_code="UNKNOWN_COMMAND", error_msg="Unknown command 'nope'."
+    )
+
+    assert not manager.publish.called
+    ack_call, completion_call = manager.publish_with_retry.call_args_list
+    assert ack_call[0][0] == "icsia/test_device/status/ack"
+    assert completion_call[0][0] == "icsia/test_device/status/completion"
+    assert completion_call[0][1]["error_code"] == "UNKNOWN_COMMAND"
+
+
 @pytest.mark.asyncio
 async def test_status_publisher_error_path_updates(
     trackable_command_handler, trackable_status_publisher, trackable_connection_manager
@@ -23,13 +23,23 @@ The tests verify the optimized publishing behavior provides maximum efficiency
 while maintaining responsiveness and monitoring capabilities.
 """
 
+import asyncio
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
 
 import pytest
 
 from mqtt_application.command_handler import AsyncCommandHandler
-from mqtt_application.status_publisher import StatusValidationError
+from mqtt_application.status_publisher import PeriodicStatusPublisher, StatusValidationError
+
+# Fixed command payloads, spelled out as the exact text json.dumps() produces
+# so tests don't re-encode them on every run (checked by test_static_payloads_match_json_dumps)
+MISSING_COMMAND_PAYLOAD = '{"cmd_id": "test_123", "data": {}}'
+MISSING_CMD_ID_PAYLOAD = '{"command": "test_command", "data": {}}'
+START_TASK_PAYLOAD = '{"command": "start_task", "cmd_id": "test_123", "data": {}}'
+UNKNOWN_COMMAND_PAYLOAD = '{"command": "unknown_command", "cmd_id": "test_123", "data": {}}'
+FAILING_COMMAND_PAYLOAD = '{"command": "failing_command", "cmd_id": "test_123", "data": {}}'
 
 
 @pytest.fixture
@@ -58,8 +68,6 @@ class TestImmediateStatusPublishing:
     @pytest.mark.asyncio
     async def test_immediate_publish_on_status_change(self, mqtt_logger, trackable_connection_manager):
         """Test that status changes trigger immediate publish."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -79,8 +87,6 @@ class TestImmediateStatusPublishing:
     @pytest.mark.asyncio
     async def test_immediate_publish_on_operational_status_change(self, mqtt_logger, trackable_connection_manager):
         """Test that operational status changes trigger immediate publish."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -98,8 +104,6 @@ class TestImmediateStatusPublishing:
     @pytest.mark.asyncio
     async def test_no_immediate_publish_on_same_values(self, mqtt_logger, trackable_connection_manager):
         """Test that updating with same values doesn't trigger immediate publish."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -124,8 +128,6 @@ class TestKeepAlivePublishing:
     @pytest.mark.asyncio
     async def test_change_only_publishing_default(self, mqtt_logger, trackable_connection_manager):
         """Test that change-only publishing is enabled by default."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         # Default configuration
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
@@ -141,8 +143,6 @@ class TestKeepAlivePublishing:
     @pytest.mark.asyncio
     async def test_keepalive_publishing_enabled(self, mqtt_logger, trackable_connection_manager):
         """Test keep-alive publishing configuration."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         # Enable keep-alive
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
@@ -159,8 +159,6 @@ class TestKeepAlivePublishing:
     @pytest.mark.asyncio
     async def test_status_change_detection(self, mqtt_logger, trackable_connection_manager):
         """Test status change detection logic."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -194,6 +192,38 @@ class TestKeepAlivePublishing:
         }
         assert publisher._status_changed(status3) is True
 
+        # Added or removed fields - should be considered changed
+        assert publisher._status_changed({**status2, "extra": None}) is True
+        assert publisher._status_changed({"operational_status": "idle", "timestamp": "2025-01-01T12:01:00Z"}) is True
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_skips_building(self, mqtt_logger, trackable_connection_manager):
+        """Test that a tick with nothing changed since the last publish doesn't build a payload."""
+        publisher = PeriodicStatusPublisher(
+            device_id="test_device",
+            logger=mqtt_logger,
+            connection_manager=trackable_connection_manager,
+            config_status_payload={"sensor_value": 0.0},
+        )
+        await publisher._publish_status(force=True)
+
+        build = MagicMock(wraps=publisher._build_status_payload)
+        publisher._build_status_payload = build
+
+        # Nothing changed: skipped before building
+        await publisher._publish_status()
+        build.assert_not_called()
+
+        # A new command time changes the payload, so it is built and published
+        publisher.update_last_command_time()
+        await publisher._publish_status()
+        build.assert_called_once()
+        assert trackable_connection_manager.publish.call_count == 2
+
+        # Unchanged again after that publish
+        await publisher._publish_status()
+        build.assert_called_once()
+
 
 class TestRetainedMessages:
     """Test MQTT retained message functionality."""
@@ -201,8 +231,6 @@ class TestRetainedMessages:
     @pytest.mark.asyncio
     async def test_retained_messages_enabled_by_default(self, mqtt_logger, trackable_connection_manager):
         """Test that retained messages are enabled by default."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -221,8 +249,6 @@ class TestRetainedMessages:
     @pytest.mark.asyncio
     async def test_publish_immediately_method(self, mqtt_logger, trackable_connection_manager):
         """Test the publish_immediately method bypasses change detection."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         publisher = PeriodicStatusPublisher(
             device_id="test_device",
             logger=mqtt_logger,
@@ -265,7 +291,7 @@ class TestStatusValidationIntegration:
         assert call_args[0][0] == "icsia/test_device/status/ack"
 
         # Check payload structure
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["cmd_id"] == "cmd_123"
         assert payload["status"] == "received"
         assert payload["command_timestamp"] == "2025-08-10T14:30:15.123Z"
@@ -292,7 +318,7 @@ class TestStatusValidationIntegration:
         call_args = trackable_connection_manager.publish.call_args
 
         # Check payload structure
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["cmd_id"] == "cmd_123"
         assert payload["status"] == "error"
         assert payload["command_timestamp"] == "2025-08-10T14:30:15.123Z"
@@ -338,7 +364,7 @@ class TestCompletionMessages:
         assert call_args[0][0] == "icsia/test_device/status/completion"
 
         # Check payload structure
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["cmd_id"] == "cmd_123"
         assert payload["status"] == "completed"
         assert payload["command_timestamp"] == "2025-08-10T14:30:15.123Z"
@@ -365,7 +391,7 @@ class TestCompletionMessages:
         call_args = trackable_connection_manager.publish.call_args
 
         # Check payload structure
-        payload = call_args[0][1]
+        payload = json.loads(call_args[0][1])
         assert payload["cmd_id"] == "cmd_123"
         assert payload["status"] == "error"
         assert payload["command_timestamp"] == "2025-08-10T14:30:15.123Z"
@@ -377,16 +403,18 @@ class TestCompletionMessages:
 class TestCommandHandlerErrorScenarios:
     """Test error scenarios in command handling with new status structure."""
 
+    def test_static_payloads_match_json_dumps(self):
+        """Test that the precomputed payload literals are what json.dumps() would produce."""
+        assert MISSING_COMMAND_PAYLOAD == json.dumps({"cmd_id": "test_123", "data": {}})
+        assert MISSING_CMD_ID_PAYLOAD == json.dumps({"command": "test_command", "data": {}})
+        assert START_TASK_PAYLOAD == json.dumps({"command": "start_task", "cmd_id": "test_123", "data": {}})
+        assert UNKNOWN_COMMAND_PAYLOAD == json.dumps({"command": "unknown_command", "cmd_id": "test_123", "data": {}})
+        assert FAILING_COMMAND_PAYLOAD == json.dumps({"command": "failing_command", "cmd_id": "test_123", "data": {}})
+
     @pytest.mark.asyncio
     async def test_missing_command_error(self, command_handler_with_config, trackable_connection_manager):
         """Test error handling when command is missing."""
-        payload = json.dumps(
-            {
-                "cmd_id": "test_123",
-                # Missing 'command' field
-                "data": {},
-            }
-        )
+        payload = MISSING_COMMAND_PAYLOAD  # Missing 'command' field
 
         await command_handler_with_config.handle_command("icsia/test_device/cmd", payload)
 
@@ -394,7 +422,7 @@ class TestCommandHandlerErrorScenarios:
         trackable_connection_manager.publish.assert_called_once()
         call_args = trackable_connection_manager.publish.call_args
 
-        payload_data = call_args[0][1]
+        payload_data = json.loads(call_args[0][1])
         assert payload_data["status"] == "error"
         assert payload_data["error_code"] == "INVALID_PAYLOAD"
         assert (
@@ -405,13 +433,7 @@ class TestCommandHandlerErrorScenarios:
     @pytest.mark.asyncio
     async def test_missing_cmd_id_error(self, command_handler_with_config, trackable_connection_manager):
         """Test error handling when cmd_id is missing."""
-        payload = json.dumps(
-            {
-                "command": "test_command",
-                # Missing 'cmd_id' field
-                "data": {},
-            }
-        )
+        payload = MISSING_CMD_ID_PAYLOAD  # Missing 'cmd_id' field
 
         await command_handler_with_config.handle_command("icsia/test_device/cmd/test_command", payload)
 
@@ -419,7 +441,7 @@ class TestCommandHandlerErrorScenarios:
         trackable_connection_manager.publish.assert_called_once()
         call_args = trackable_connection_manager.publish.call_args
 
-        payload_data = call_args[0][1]
+        payload_data = json.loads(call_args[0][1])
         assert payload_data["status"] == "error"
         assert payload_data["error_code"] == "INVALID_PAYLOAD"
         assert payload_data["error_msg"] == "Missing required field 'cmd_id'. Include cmd_id field in command payload."
@@ -435,7 +457,7 @@ class TestCommandHandlerErrorScenarios:
         trackable_connection_manager.publish.assert_called_once()
         call_args = trackable_connection_manager.publish.call_args
 
-        payload_data = call_args[0][1]
+        payload_data = json.loads(call_args[0][1])
         assert payload_data["status"] == "error"
         assert payload_data["error_code"] == "INVALID_JSON"
         assert "Invalid JSON payload:" in payload_data["error_msg"]
@@ -448,7 +470,7 @@ class TestCommandHandlerErrorScenarios:
         command_handler_with_config.command_schemas["start_task"] = {"required_param": "test_value"}
 
         # Create a payload that will fail validation (missing required_param)
-        payload = json.dumps({"command": "start_task", "cmd_id": "test_123", "data": {}})
+        payload = START_TASK_PAYLOAD
 
         await command_handler_with_config.handle_command("icsia/test_device/cmd/start_task", payload)
 
@@ -470,7 +492,7 @@ class TestCommandHandlerErrorScenarios:
     @pytest.mark.asyncio
     async def test_unknown_command_error(self, command_handler_with_config, trackable_connection_manager):
         """Test unknown command sends proper completion error."""
-        payload = json.dumps({"command": "unknown_command", "cmd_id": "test_123", "data": {}})
+        payload = UNKNOWN_COMMAND_PAYLOAD
 
         await command_handler_with_config.handle_command("icsia/test_device/cmd/unknown_command", payload)
 
@@ -495,7 +517,7 @@ class TestCommandHandlerErrorScenarios:
 
         command_handler_with_config.commands["failing_command"] = failing_command
 
-        payload = json.dumps({"command": "failing_command", "cmd_id": "test_123", "data": {}})
+        payload = FAILING_COMMAND_PAYLOAD
 
         await command_handler_with_config.handle_command("icsia/test_device/cmd/failing_command", payload)
 
@@ -504,7 +526,7 @@ class TestCommandHandlerErrorScenarios:
 
         # Check completion (second call)
         completion_call = trackable_connection_manager.publish.call_args_list[1]
-        completion_payload = completion_call[0][1]
+        completion_payload = json.loads(completion_call[0][1])
         assert completion_payload["status"] == "error"
         assert completion_payload["error_code"] == "EXECUTION_ERROR"
         assert "Command execution failed" in completion_payload["error_msg"]
@@ -519,8 +541,6 @@ class TestPublishingBehaviorIntegration:
         """Test immediate publishing with real MQTT connection."""
         import uuid
 
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         # Create unique test topic
         test_id = str(uuid.uuid4())
 
@@ -558,8 +578,6 @@ class TestPublishingBehaviorIntegration:
     @pytest.mark.asyncio
     async def test_keepalive_vs_change_only_behavior(self, mqtt_logger, trackable_connection_manager):
         """Test behavior difference between keep-alive and change-only modes."""
-        from mqtt_application.status_publisher import PeriodicStatusPublisher
-
         # Test change-only mode (default)
         publisher_change_only = PeriodicStatusPublisher(
             device_id="test_device",
@@ -596,7 +614,7 @@ class TestErrorCodes:
     """Test specific error codes are used correctly."""
 
     @pytest.mark.asyncio
-    async def test_all_error_codes_coverage(self, command_handler_with_config, trackable_connection_manager):
+    async def test_all_error_codes_coverage(self, recording_handler_factory):
         """Test that all defined error codes are used appropriately."""
         test_cases = [
             {
@@ -625,24 +643,28 @@ class TestErrorCodes:
             },
         ]
 
-        for test_case in test_cases:
-            trackable_connection_manager.publish.reset_mock()
-
-            # Use appropriate topic for the test scenario
-            topic = "icsia/test_device/cmd"
-            if test_case["scenario"] == "unknown_command":
-                topic = "icsia/test_device/cmd/unknown"
-
-            await command_handler_with_config.handle_command(topic, test_case["payload"])
+        # Scenarios are independent, so run them concurrently on separate handlers
+        handlers = [recording_handler_factory() for _ in test_cases]
+        await asyncio.gather(
+            *[
+                handler.handle_command(
+                    # Use appropriate topic for the test scenario
+                    (
+                        "icsia/test_device/cmd/unknown"
+                        if test_case["scenario"] == "unknown_command"
+                        else "icsia/test_device/cmd"
+                    ),
+                    test_case["payload"],
+                )
+                for (handler, _recorder), test_case in zip(handlers, test_cases)
+            ]
+        )
 
+        for (_handler, recorder), test_case in zip(handlers, test_cases):
             # Find the call with the expected error code
-            found_error = False
-            for call in trackable_connection_manager.publish.call_args_list:
-                payload = call[0][1]
-                if payload.get("error_code") == test_case["expected_code"]:
-                    found_error = True
-                    break
-
+            found_error = any(
+                payload.get("error_code") == test_case["expected_code"] for _topic, payload in recorder.calls
+            )
             assert found_error, f"Error code {test_case['expected_code']} not found for {test_case['scenario']}"
 
 
@@ -688,10 +710,8 @@ async def test_custom_status_payload_update(status_publisher):
 
 
 @pytest.mark.asyncio
-async def test_status_payload_with_config_defaults(mqtt_logger, connection_manager):
+async def test_status_payload_with_config_defaults(status_publisher_factory):
     """Test status payload uses defaults from config when values not provided."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
     # Mock config with defaults
     config_payload = {
         "voltage": {"default": 12.0},
@@ -700,12 +720,7 @@ async def test_status_payload_with_config_defaults(mqtt_logger, connection_manag
         "system_mode": "idle",
     }
 
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=config_payload,
-    )
+    publisher = status_publisher_factory(config_payload)
 
     # Only update some values
     publisher.update_status_payload({"temperature": 30.0, "speed": 200})
@@ -722,16 +737,9 @@ async def test_status_payload_with_config_defaults(mqtt_logger, connection_manag
 
 
 @pytest.mark.asyncio
-async def test_status_payload_multiple_updates(mqtt_logger, connection_manager):
+async def test_status_payload_multiple_updates(status_publisher_factory):
     """Test multiple status payload updates work correctly."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload={"counter": 0, "mode": "idle"},
-    )
+    publisher = status_publisher_factory({"counter": 0, "mode": "idle"})
 
     # First update
     publisher.update_status_payload({"counter": 1, "mode": "active"})
@@ -753,16 +761,70 @@ async def test_status_payload_multiple_updates(mqtt_logger, connection_manager):
     assert payload3["new_field"] == "test"  # New field
 
 
-@pytest.mark.integration
 @pytest.mark.asyncio
-async def test_motor_control_status_payload_integration():
+async def test_status_publisher_reset(status_publisher_factory):
+    """Test that reset() restores defaults and clears state from earlier use."""
+    publisher = status_publisher_factory({"counter": 0})
+    publisher.update_status_payload({"counter": 5, "extra": "value"})
+    publisher.set_operational_status("busy")
+    publisher.update_last_command_time()
+
+    publisher.reset({"mode": {"default": "idle"}})
+    payload = publisher._build_status_payload()
+
+    assert payload["mode"] == "idle"
+    assert "counter" not in payload
+    assert "extra" not in payload
+    assert "last_command_time" not in payload
+    assert payload["operational_status"] == "idle"
+    assert publisher._pending_immediate_publish is False
+
+
+@pytest.mark.asyncio
+async def test_generated_payload_builder_matches_generic(status_publisher_factory):
+    """Test that the config-specialized payload builder matches the generic one."""
+    publisher = status_publisher_factory({"counter": 0, "mode": {"default": "idle"}, "operational_status": "x"})
+    publisher.update_status_payload({"counter": 3, "extra": True})
+    publisher.update_last_command_time()
+
+    assert publisher._payload_builder is not None
+    generated = publisher._build_status_payload()
+    publisher._payload_builder = None  # Fall back to the generic path
+    generic = publisher._build_status_payload()
+
+    generated.pop("timestamp")
+    generic.pop("timestamp")
+    assert list(generated.items()) == list(generic.items())
+
+
+@pytest.mark.asyncio
+async def test_status_publisher_reset_restores_validation(status_publisher_factory):
+    """Test that resetting from no config to a config validates updates again."""
+    publisher = status_publisher_factory(None)
+    publisher.update_status_payload({"counter": "anything"})
+
+    publisher.reset({"counter": 0})
+
+    with pytest.raises(StatusValidationError) as exc_info:
+        publisher.update_status_payload({"counter": "anything"})
+    assert str(exc_info.value) == "Field 'counter' expected int, got str"
+
+
+@pytest.mark.asyncio
+async def test_motor_control_status_payload_integration(monkeypatch):
     """Integration test for motor control status payload."""
-    from mqtt_application import MqttApplication
+    from fake_broker import InProcessBroker, InProcessLogger
+
+    from mqtt_application import MqttApplication, application
+
+    # Run the whole application against in-memory broker and logger
+    broker = InProcessBroker()
+    monkeypatch.setattr(application, "MqttConnectionManager", lambda **kwargs: broker)
+    monkeypatch.setattr(MqttApplication, "_create_logger", lambda self: InProcessLogger())
 
     # Motor control configuration
     config_override = {
         "device_id": "test_motor_01",
-        "mqtt": {"broker": "test.mosquitto.org", "port": 1883},
         "status_payload": {
             "current_position": {"x": 0.0, "y": 0.0, "z": 0.0},
             "speed": 100,
@@ -798,19 +860,23 @@ async def test_motor_control_status_payload_integration():
         assert "operational_status" in status_payload
         assert "timestamp" in status_payload
 
+        # Status goes out through the in-process broker
+        await app.status_publisher.publish_immediately()
+        status_topic = "icsia/test_motor_01/status/current"
+        published = None
+        while not broker.messages.empty():
+            topic, payload = broker.messages.get_nowait()
+            if topic == status_topic:
+                published = payload
+        assert published is not None
+        assert published["current_position"] == motor_status["current_position"]
+
 
 @pytest.mark.asyncio
-async def test_empty_config_payload_fallback(mqtt_logger, connection_manager):
+async def test_empty_config_payload_fallback(status_publisher_factory):
     """Test that publisher works with empty config payload."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
     # No config payload provided
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=None,
-    )
+    publisher = status_publisher_factory(None)
 
     # Should still work with basic status
     status_payload = publisher._build_status_payload()
@@ -833,10 +899,8 @@ async def test_empty_config_payload_fallback(mqtt_logger, connection_manager):
 
 
 @pytest.mark.asyncio
-async def test_status_payload_validation_type_mismatch(mqtt_logger, connection_manager):
+async def test_status_payload_validation_type_mismatch(status_publisher_factory):
     """Test that status update fails when data type doesn't match config."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
     # Config expects specific types
     config_payload = {
         "temperature": 25.0,  # float
@@ -845,44 +909,47 @@ async def test_status_payload_validation_type_mismatch(mqtt_logger, connection_m
         "system_mode": "idle",  # str
     }
 
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=config_payload,
-    )
+    publisher = status_publisher_factory(config_payload)
 
     # Test type mismatches
-    with pytest.raises(StatusValidationError, match="Field 'temperature' expected float, got str"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"temperature": "hot"})
+    assert str(exc_info.value) == "Field 'temperature' expected float, got str"
 
-    with pytest.raises(StatusValidationError, match="Field 'speed' expected int, got float"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"speed": 100.5})
+    assert str(exc_info.value) == "Field 'speed' expected int, got float"
 
-    with pytest.raises(StatusValidationError, match="Field 'moving' expected bool, got str"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"moving": "yes"})
+    assert str(exc_info.value) == "Field 'moving' expected bool, got str"
 
-    with pytest.raises(StatusValidationError, match="Field 'system_mode' expected str, got int"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"system_mode": 123})
+    assert str(exc_info.value) == "Field 'system_mode' expected str, got int"
 
 
 @pytest.mark.asyncio
-async def test_status_payload_validation_dict_structure(mqtt_logger, connection_manager):
-    """Test validation of nested dictionary structures."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
+async def test_status_payload_validation_accepts_subclasses(status_publisher_factory):
+    """Test that values of a subclass of the expected type still validate."""
+    publisher = status_publisher_factory({"error_count": 0, "position": {"count": 0}})
+
+    # bool is a subclass of int
+    publisher.update_status_payload({"error_count": True, "position": {"count": False}})
+
+    assert publisher._build_status_payload()["error_count"] is True
 
+
+@pytest.mark.asyncio
+async def test_status_payload_validation_dict_structure(status_publisher_factory):
+    """Test validation of nested dictionary structures."""
     # Config with nested structure
     config_payload = {
         "position": {"x": 0.0, "y": 0.0, "z": 0.0},
         "sensor_data": {"temperature": 25.0, "humidity": 50.0},
     }
 
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=config_payload,
-    )
+    publisher = status_publisher_factory(config_payload)
 
     # Valid nested structure should work
     valid_update = {
@@ -892,19 +959,44 @@ async def test_status_payload_validation_dict_structure(mqtt_logger, connection_
     publisher.update_status_payload(valid_update)
 
     # Missing required keys should fail
-    with pytest.raises(StatusValidationError, match="Field 'position' missing required key 'z'"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"position": {"x": 10.0, "y": 20.0}})
+    assert str(exc_info.value) == "Field 'position' missing required key 'z'"
 
     # Wrong nested type should fail
-    with pytest.raises(StatusValidationError, match="Field 'position.x' expected float, got str"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"position": {"x": "invalid", "y": 20.0, "z": -5.2}})
+    assert str(exc_info.value) == "Field 'position.x' expected float, got str"
 
 
 @pytest.mark.asyncio
-async def test_status_payload_validation_with_defaults(mqtt_logger, connection_manager):
-    """Test validation works correctly with default value configs."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
+async def test_generated_status_check_matches_validator(status_publisher_factory):
+    """Test that the generated status check accepts exactly what the validator accepts."""
+    publisher = status_publisher_factory(
+        {"temperature": {"default": 25.0}, "speed": 100, "position": {"x": 0.0, "y": 0.0}}
+    )
+    cases = [
+        {"temperature": 30.5, "speed": 5, "position": {"x": 1.0, "y": 2.0}},
+        {"temperature": 30, "speed": 5},
+        {"speed": True},
+        {"position": {"x": 1.0}},
+        {"position": {"x": 1.0, "y": "2"}},
+        {"position": [1.0, 2.0]},
+        {"unrelated": object()},
+    ]
+
+    for values in cases:
+        try:
+            publisher._validate_status_payload(values)
+            valid = True
+        except StatusValidationError:
+            valid = False
+        assert publisher._check_status_payload(values) is valid, values
 
+
+@pytest.mark.asyncio
+async def test_status_payload_validation_with_defaults(status_publisher_factory):
+    """Test validation works correctly with default value configs."""
     # Config with default values
     config_payload = {
         "temperature": {"default": 25.0},
@@ -912,38 +1004,28 @@ async def test_status_payload_validation_with_defaults(mqtt_logger, connection_m
         "status_message": {"default": "ok"},
     }
 
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=config_payload,
-    )
+    publisher = status_publisher_factory(config_payload)
 
     # Valid types matching defaults should work
     publisher.update_status_payload({"temperature": 30.5, "error_count": 2, "status_message": "warning"})
 
     # Invalid types should fail even with default configs
-    with pytest.raises(StatusValidationError, match="Field 'temperature' expected float, got int"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"temperature": 30})
+    assert str(exc_info.value) == "Field 'temperature' expected float, got int"
 
-    with pytest.raises(StatusValidationError, match="Field 'error_count' expected int, got str"):
+    with pytest.raises(StatusValidationError) as exc_info:
         publisher.update_status_payload({"error_count": "none"})
+    assert str(exc_info.value) == "Field 'error_count' expected int, got str"
 
 
 @pytest.mark.asyncio
-async def test_status_payload_validation_allows_extra_fields(mqtt_logger, connection_manager):
+async def test_status_payload_validation_allows_extra_fields(status_publisher_factory):
     """Test that validation allows fields not defined in config."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
     # Limited config
     config_payload = {"temperature": 25.0}
 
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=config_payload,
-    )
+    publisher = status_publisher_factory(config_payload)
 
     # Should allow extra fields not in config (for flexibility)
     publisher.update_status_payload(
@@ -961,17 +1043,10 @@ async def test_status_payload_validation_allows_extra_fields(mqtt_logger, connec
 
 
 @pytest.mark.asyncio
-async def test_status_payload_validation_no_config(mqtt_logger, connection_manager):
+async def test_status_payload_validation_no_config(status_publisher_factory):
     """Test that validation is skipped when no config is provided."""
-    from mqtt_application.status_publisher import PeriodicStatusPublisher
-
     # No config payload
-    publisher = PeriodicStatusPublisher(
-        device_id="test_device",
-        logger=mqtt_logger,
-        connection_manager=connection_manager,
-        config_status_payload=None,
-    )
+    publisher = status_publisher_factory(None)
 
     # Should accept any values without validation
     publisher.update_status_payload(
@@ -1014,12 +1089,63 @@ async def test_application_status_validation_integration():
         app.update_status(valid_status)
 
         # Invalid type should raise exception
-        with pytest.raises(StatusValidationError, match="Field 'speed' expected int, got str"):
+        with pytest.raises(StatusValidationError) as exc_info:
             app.update_status({"speed": "fast"})
+        assert str(exc_info.value) == "Field 'speed' expected int, got str"
 
         # Missing required nested key should fail
-        with pytest.raises(
-            StatusValidationError,
-            match="Field 'motor_position' missing required key 'y'",
-        ):
+        with pytest.raises(StatusValidationError) as exc_info:
             app.update_status({"motor_position": {"x": 10.0, "z": 5.0}})
+        assert str(exc_info.value) == "Field 'motor_position' missing required key 'y'"
+
+
+@pytest.mark.asyncio
+async def test_subclass_update_status_payload_override(null_logger, connection_manager):
+    """Test that a subclass override of update_status_payload is used without a status config."""
+
+    class CountingPublisher(PeriodicStatusPublisher):
+        calls = 0
+
+        def update_status_payload(self, values):
+            type(self).calls += 1
+            super().update_status_payload(values)
+
+    publisher = CountingPublisher(device_id="test_device", logger=null_logger, connection_manager=connection_manager)
+    publisher.update_status_payload({"anything": "goes"})
+
+    assert CountingPublisher.calls == 1
+    assert publisher._build_status_payload()["anything"] == "goes"
+
+
+@pytest.mark.asyncio
+async def test_subclass_build_status_payload_override(null_logger, connection_manager):
+    """Test that a subclass override of _build_status_payload is used when a config is present."""
+
+    class TaggedPublisher(PeriodicStatusPublisher):
+        def _build_status_payload(self):
+            status_data = super()._build_status_payload()
+            status_data["tagged"] = True
+            return status_data
+
+    publisher = TaggedPublisher(
+        device_id="test_device",
+        logger=null_logger,
+        connection_manager=connection_manager,
+        config_status_payload={"counter": 0},
+    )
+
+    payload = publisher._build_status_payload()
+    assert payload["tagged"] is True
+    assert payload["counter"] == 0
+
+
+def test_last_command_time_keeps_its_utc_offset(status_publisher_factory):
+    """Test that equal instants in different time zones are formatted with their own offsets."""
+    publisher = status_publisher_factory({"counter": 0})
+    utc_time = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    publisher.last_command_time = utc_time
+    assert publisher._build_status_payload()["last_command_time"] == "2025-01-01T12:00:00.000Z"
+
+    publisher.last_command_time = utc_time.astimezone(timezone(timedelta(hours=1)))
+    assert publisher._build_status_payload()["last_command_time"] == "2025-01-01T13:00:00.000+01:00"